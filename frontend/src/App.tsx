@@ -110,7 +110,8 @@ function App() {
     await Promise.all([refreshBrains(), refreshJobs()]);
   }, [refreshBrains, refreshJobs]);
 
-  const pendingJobs = jobs.filter(job => job.status === 'processing').length;
+  const isIngestionActive = (job: IngestionJob) => job.status === 'processing' || job.status === 'timed_out';
+  const pendingJobs = jobs.filter(isIngestionActive).length;
   const pendingEnrichmentJobs = enrichmentJobs.filter(job => job.status === 'processing').length;
   const totalPendingJobs = pendingJobs + pendingEnrichmentJobs;
 
@@ -219,7 +220,7 @@ function App() {
             ) : (
               <ul>
                 {jobs
-                  .filter(job => job.status === 'processing')
+                  .filter(isIngestionActive)
                   .map(job => (
                     <li key={`ingest_${job.job_id || job.started_at}`}>
                       <Loader2 size={12} className="animate-spin" />
@@ -78,7 +78,7 @@ export interface EnrichmentJob {
 export interface IngestionJob {
     job_id?: string;
     brain_name: string;
-    status: 'processing' | 'completed' | 'failed';
+    status: 'processing' | 'timed_out' | 'completed' | 'failed';
     started_at: string;
     completed_at: string | null;
     error: string | null;
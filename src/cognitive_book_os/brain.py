@@ -5,6 +5,10 @@ from pathlib import Path
 from typing import Optional
 from .models import AnchorState, ProcessingLog
 
+# Brain-relative directory for derived caches (e.g. the query cache); it holds
+# no knowledge, so list_files() skips it
+CACHE_DIR = ".cache"
+
 
 class Brain:
     """
@@ -111,20 +115,23 @@ This file tracks the structure of the knowledge base.
         log = ProcessingLog(book_path="", objective=objective)
         self.write_file("meta/processing_log.json", log.model_dump_json(indent=2))
     
-    def write_file(self, relative_path: str, content: str) -> Path:
+    def write_file(self, relative_path: str, content: str | bytes) -> Path:
         """
         Write content to a file in the brain.
         
         Args:
             relative_path: Path relative to brain root
-            content: Content to write
+            content: Content to write (bytes are written as-is, assumed UTF-8)
             
         Returns:
             Absolute path to the file
         """
         file_path = self._resolve_relative_path(relative_path)
         file_path.parent.mkdir(parents=True, exist_ok=True)
-        file_path.write_text(content, encoding="utf-8")
+        if isinstance(content, bytes):
+            file_path.write_bytes(content)
+        else:
+            file_path.write_text(content, encoding="utf-8")
         return file_path
     
     def read_file(self, relative_path: str) -> Optional[str]:
@@ -173,9 +180,10 @@ This file tracks the structure of the knowledge base.
             return []
         
         root_path = self.path.resolve()
+        cache_path = root_path / CACHE_DIR
         files = []
         for file_path in search_path.rglob("*"):
-            if file_path.is_file():
+            if file_path.is_file() and cache_path not in file_path.parents:
                 files.append(str(file_path.relative_to(root_path)))
         return sorted(files)
     
@@ -36,6 +36,11 @@ CLAIMS_LOCK_FILE = "meta/claims.lock"
 TRUE_VALUES = {"1", "true", "yes", "on"}
 
 
+def claim_cursor(claim: ClaimSnapshot) -> str:
+    """Opaque keyset cursor for ``ClaimStore.list_claims(after=...)``."""
+    return f"{claim.updated_at}|{claim.claim_id}"
+
+
 def _now_iso() -> str:
     return datetime.now().isoformat()
 
@@ -300,8 +305,21 @@ class ClaimStore:
         q: str | None = None,
         limit: int = 100,
         offset: int = 0,
+        after: str | None = None,
     ) -> list[ClaimSnapshot]:
+        """List current claims, newest first.
+
+        ``after`` is a cursor from ``claim_cursor`` of the last claim on the
+        previous page; it is preferred over ``offset`` for deep pages.
+        Raises ``ValueError`` for a malformed cursor.
+        """
         claims = list(self.load_current_claims().values())
+        if after is not None:
+            after_updated_at, sep, after_claim_id = after.partition("|")
+            if not sep:
+                raise ValueError(f"Invalid claim cursor: {after!r}")
+            after_key = (after_updated_at, after_claim_id)
+            claims = [c for c in claims if (c.updated_at, c.claim_id) < after_key]
 
         if file_path:
             claims = [c for c in claims if c.file_path == file_path]
@@ -316,7 +334,7 @@ class ClaimStore:
                 if term in c.claim_text.lower() or term in c.evidence_quote.lower()
             ]
 
-        claims.sort(key=lambda c: c.updated_at, reverse=True)
+        claims.sort(key=lambda c: (c.updated_at, c.claim_id), reverse=True)
         return claims[offset:offset + max(limit, 0)]
 
     def get_claim(self, claim_id: str) -> ClaimSnapshot | None:
@@ -16,12 +16,6 @@ from .claim_store import ClaimStore, claims_versioning_enabled
 from .ingest import process_document, final_synthesis
 from .llm import get_client
 from .models import ClaimStatus
-from .orchestration import (
-    BrainNotFoundError,
-    MultiBrainInputError,
-    multi_brain_query_enabled,
-    orchestrate_multi_brain_query,
-)
 from .query import (
     answer_from_brain_with_audit,
     interactive_query,
@@ -428,6 +422,13 @@ def multi_query(
     """
     Query multiple brains and return a unified answer with conflicts.
     """
+    from .orchestration import (
+        BrainNotFoundError,
+        MultiBrainInputError,
+        multi_brain_query_enabled,
+        orchestrate_multi_brain_query,
+    )
+
     if not multi_brain_query_enabled():
         console.print("[yellow]Multi-brain query is disabled. Set ENABLE_MULTI_BRAIN_QUERY=1.[/yellow]")
         raise typer.Exit(1)
@@ -6,7 +6,7 @@ from rich.console import Console
 from .brain import Brain
 from .models import ChapterStatus
 from .ingest import process_document
-from .llm import LLMClient
+from .llm import get_client
 from .config import BRAIN_MODEL
 
 console = Console()
@@ -123,7 +123,7 @@ RESULT: [YES or NO]
 """
 
         # Call LLM
-        client = LLMClient(provider=provider, model=model or BRAIN_MODEL)
+        client = get_client(provider=provider, model=model or BRAIN_MODEL)
         response = client.generate_text(system_prompt, user_prompt, max_tokens=200).strip()
         
         # Parse response - look for RESULT line
@@ -144,7 +144,7 @@ RESULT: [YES or NO]
         
         return should_enrich, target_chapters
 
-    def enrich(self, new_objective: str, provider: str = "anthropic", model: str | None = None) -> None:
+    def enrich(self, new_objective: str, provider: str = "anthropic", model: str | None = None) -> list[str]:
         """
         Perform the enrichment (delta scan).
         
@@ -152,10 +152,13 @@ RESULT: [YES or NO]
             new_objective: The new question/topic to look for.
             provider: LLM provider
             model: Optional model override
+            
+        Returns:
+            Knowledge files created or updated by the enrichment pass
         """
         if not self.brain.exists():
             console.print(f"[bold red]Error:[/bold red] Brain '{self.brain_name}' not found.")
-            return
+            return []
             
         log = self.brain.get_processing_log()
         
@@ -168,7 +171,7 @@ RESULT: [YES or NO]
         if not skipped_chapters:
             console.print("[yellow]No skipped chapters found to enrich.[/yellow]")
             console.print("The brain might be fully extracted already, or created with a legacy version.")
-            return
+            return []
             
         console.print(f"[bold cyan]Enrichment Protocol Initiated[/bold cyan]")
         console.print(f"Target: {len(skipped_chapters)} previously skipped chapters")
@@ -178,12 +181,13 @@ RESULT: [YES or NO]
         book_path = Path(log.book_path)
         if not book_path.exists():
             console.print(f"[bold red]Error:[/bold red] Original source file not found at: {book_path}")
-            return
+            return []
             
         # Run Pipeline (Targeted)
         # We enforce 'triage' strategy to save costs on the new pass.
         # If the user wants to force-read everything, they should use 'ingest --strategy standard'
         # with specific flags, but 'enrich' implies efficiency.
+        before = self._knowledge_file_mtimes()
         process_document(
             document_path=book_path,
             brain_name=self.brain_name,
@@ -205,5 +209,20 @@ RESULT: [YES or NO]
             
         console.print(f"[bold green]Enrichment Complete.[/bold green]")
         console.print(f"Updated metadata: meta/processing_log.json")
+        
+        after = self._knowledge_file_mtimes()
+        return [path for path, mtime in after.items() if before.get(path) != mtime]
+    
+    def _knowledge_file_mtimes(self) -> dict[str, int]:
+        """Map knowledge files (excluding meta/ and _-prefixed) to their mtime."""
+        mtimes = {}
+        for rel_path in self.brain.list_files():
+            if rel_path.startswith("meta/") or rel_path.startswith("_"):
+                continue
+            try:
+                mtimes[rel_path] = (self.brain.path / rel_path).stat().st_mtime_ns
+            except OSError:
+                continue
+        return mtimes
 
 
@@ -188,17 +188,16 @@ def process_document(
         console.print(f"Found {total_chapters} chapters/chunks to process")
         console.print()
 
-        for i, (chunk_num, chunk_title, chunk_content) in enumerate(chunks):
-            current_chapter_num = i + 1
-
-            # 1. Skip if before start_from (Resume logic)
-            # 2. Skip if not in allowed_chapters (Enrichment logic)
-            if allowed_chapters:
-                if current_chapter_num not in allowed_chapters:
-                    continue
-            elif i < start_from:
-                continue
-
+        # 1. Skip if before start_from (Resume logic)
+        # 2. Skip if not in allowed_chapters (Enrichment logic)
+        pending = [
+            (i + 1, chunk_title, chunk_content)
+            for i, (_, chunk_title, chunk_content) in enumerate(chunks)
+            if (i + 1 in allowed_chapters if allowed_chapters else i >= start_from)
+        ]
+        strategy.prepare(pending, client, objective)
+
+        for current_chapter_num, chunk_title, chunk_content in pending:
             console.print(f"[bold]Chapter {current_chapter_num}/{total_chapters}: {chunk_title}[/bold]")
 
             # Execute Strategy (Expects ChapterState return now)
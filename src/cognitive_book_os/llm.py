@@ -2,13 +2,14 @@
 
 import os
 import json
+from functools import lru_cache
 import instructor
 from openai import OpenAI
 from anthropic import Anthropic
 from dotenv import load_dotenv
 from pydantic import BaseModel
 import logging
-from typing import TypeVar, Type, Any
+from typing import Callable, TypeVar, Type, Any
 from langfuse import observe
 
 logger = logging.getLogger(__name__)
@@ -50,13 +51,17 @@ class LLMClient:
         self.provider = provider
         self.model = model or get_default_model(provider)
 
+        # The structured and raw clients share one SDK client (and so one
+        # keep-alive connection pool)
         if provider == PROVIDER_OPENAI:
-            self.client = instructor.from_openai(OpenAI())
-            self._raw_client = OpenAI()
+            openai_client = OpenAI()
+            self.client = instructor.from_openai(openai_client)
+            self._raw_client = openai_client
 
         elif provider == PROVIDER_ANTHROPIC:
-            self.client = instructor.from_anthropic(Anthropic())
-            self._raw_client = Anthropic()
+            anthropic_client = Anthropic()
+            self.client = instructor.from_anthropic(anthropic_client)
+            self._raw_client = anthropic_client
 
         elif provider == PROVIDER_OPENROUTER:
             # OpenRouter uses OpenAI-compatible API
@@ -99,7 +104,9 @@ class LLMClient:
         user_prompt: str,
         temperature: float = 0.7,
         max_retries: int = 3,
-        max_tokens: int = 65536
+        max_tokens: int = 65536,
+        cached_prefix: str | None = None,
+        on_partial: Callable[[Any], None] | None = None
     ) -> T:
         """
         Generate a structured response from the LLM.
@@ -111,6 +118,10 @@ class LLMClient:
             temperature: Sampling temperature
             max_retries: Number of retries for parsing failures
             max_tokens: Maximum tokens in response
+            cached_prefix: Stable leading part of the user message (e.g. a
+                file listing) that providers may cache across calls
+            on_partial: Called with each partially parsed object while the
+                response streams (Anthropic/MiniMax only)
 
         Returns:
             Parsed response as the specified Pydantic model
@@ -121,7 +132,7 @@ class LLMClient:
             "response_model": response_model,
             "messages": [
                 {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
+                {"role": "user", "content": self._user_content(user_prompt, cached_prefix)}
             ],
             "temperature": temperature,
             "max_retries": max_retries,
@@ -142,6 +153,8 @@ class LLMClient:
                 for obj in stream_result:
                     # Update status if we have a way to track it, otherwise just collect patches
                     final_obj = obj
+                    if on_partial is not None:
+                        on_partial(obj)
 
                 # Ensure we return a strict instance of the model
                 if final_obj:
@@ -165,6 +178,22 @@ class LLMClient:
         # Standard non-streaming call for others
         return self.client.chat.completions.create(**kwargs)
 
+    def _user_content(self, user_prompt: str, cached_prefix: str | None) -> Any:
+        """
+        Build user message content with the cacheable prefix first.
+
+        Anthropic needs an explicit cache_control breakpoint; OpenAI-style
+        APIs cache identical leading tokens automatically.
+        """
+        if not cached_prefix:
+            return user_prompt
+        if self.provider == PROVIDER_ANTHROPIC:
+            return [
+                {"type": "text", "text": cached_prefix, "cache_control": {"type": "ephemeral"}},
+                {"type": "text", "text": user_prompt},
+            ]
+        return f"{cached_prefix}\n{user_prompt}"
+
     @observe(as_type="generation")
     def generate_text(
         self,
@@ -305,10 +334,14 @@ class LLMClient:
             }
 
 
+@lru_cache(maxsize=16)
 def get_client(provider: str = "anthropic", model: str | None = None) -> LLMClient:
     """
     Get an LLM client instance.
 
+    Clients are cached per (provider, model), so repeated calls within a
+    process reuse the same HTTP connections.
+
     Args:
         provider: "openai", "anthropic", or "openrouter"
         model: Optional model override
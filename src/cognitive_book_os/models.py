@@ -2,7 +2,9 @@ from __future__ import annotations
 """Pydantic models for Cognitive Book OS."""
 
 
-from pydantic import BaseModel, Field, field_validator
+import re
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from typing import Optional, List, Dict, Union, Any
 from enum import Enum
 from datetime import datetime
@@ -17,6 +19,17 @@ class Confidence(str, Enum):
     NONE = "none"  # Used when no answer could be generated
 
 
+# Models that embed the shared string enums defer core-schema construction until
+# first use, so importing this module (e.g. on CLI start) stays cheap.
+_DEFERRED_CONFIG = ConfigDict(defer_build=True)
+
+# One open question per line, optionally prefixed by "1. ", "- " or "* ".
+_OPEN_QUESTION_RE = re.compile(
+    r"^[^\S\n]*(?:\d+\.[^\S\n]+|[-*][^\S\n]+)?(\S.*?)[^\S\n]*$",
+    re.MULTILINE,
+)
+
+
 class FileOperation(BaseModel):
     """Represents a file operation the LLM wants to perform."""
     action: str = Field(..., description="One of: 'create', 'update', or 'delete'")
@@ -43,6 +56,8 @@ class ExtractionResult(BaseModel):
 
 class ObjectiveSynthesis(BaseModel):
     """Result of synthesizing toward the user's objective."""
+    model_config = _DEFERRED_CONFIG
+
     new_insights: str = Field(..., description="New insights relevant to the objective from this chapter")
     updated_response: str = Field(..., description="Updated full response to the objective")
     confidence: Confidence = Field(..., description="Confidence in the current response")
@@ -55,23 +70,16 @@ class ObjectiveSynthesis(BaseModel):
     @classmethod
     def parse_open_questions(cls, v):
         """Handle case where LLM returns a string instead of a list."""
-        if isinstance(v, str):
-            questions = []
-            for line in v.split('\n'):
-                line = line.strip()
-                if line:
-                    # Remove "1. ", "- ", etc
-                    if line[0].isdigit() and '. ' in line:
-                        line = line.split('. ', 1)[1]
-                    elif line.startswith('- '):
-                        line = line[2:]
-                    questions.append(line)
-            return questions
-        return v
+        if not isinstance(v, str):
+            # Structured output already yields a list; pass it straight through.
+            return v
+        return [match.group(1) for match in _OPEN_QUESTION_RE.finditer(v)]
 
 
 class QueryResult(BaseModel):
     """Result of answering a query against the brain."""
+    model_config = _DEFERRED_CONFIG
+
     answer: str = Field(..., description="The answer to the question")
     sources: List[str] = Field(
         default_factory=list,
@@ -106,6 +114,8 @@ class ChapterStatus(str, Enum):
 
 class ChapterState(BaseModel):
     """State of a single chapter."""
+    model_config = _DEFERRED_CONFIG
+
     chapter_num: int
     status: ChapterStatus
     reason: Optional[str] = None  # e.g., "Skipped: Irrelevant to objective"
@@ -157,6 +167,8 @@ class ClaimStatus(str, Enum):
 
 class ClaimSnapshot(BaseModel):
     """Latest materialized state for a claim."""
+    model_config = _DEFERRED_CONFIG
+
     claim_id: str
     revision_id: str
     status: ClaimStatus = ClaimStatus.ACTIVE
@@ -213,6 +225,8 @@ class QueryTraceCompleteness(BaseModel):
 
 class ClaimTraceItem(BaseModel):
     """Claim-level evidence used in a query answer."""
+    model_config = _DEFERRED_CONFIG
+
     claim_id: str
     file_path: str
     claim_text: str
@@ -224,6 +238,8 @@ class ClaimTraceItem(BaseModel):
 
 class QueryAuditResult(BaseModel):
     """Audited query result with claim-level traceability."""
+    model_config = _DEFERRED_CONFIG
+
     answer: str
     sources: List[str] = Field(default_factory=list)
     confidence: Confidence
@@ -234,6 +250,8 @@ class QueryAuditResult(BaseModel):
 
 class PerBrainResult(BaseModel):
     """Per-brain section in a multi-brain query response."""
+    model_config = _DEFERRED_CONFIG
+
     brain_name: str
     answer_excerpt: str
     confidence: Confidence
@@ -273,6 +291,8 @@ class MultiBrainQueryRequest(BaseModel):
 
 class MultiBrainQueryResult(BaseModel):
     """Unified response across multiple brains."""
+    model_config = _DEFERRED_CONFIG
+
     answer: str
     confidence: Confidence
     per_brain: List[PerBrainResult] = Field(default_factory=list)
@@ -2,16 +2,23 @@
 
 from __future__ import annotations
 
+import functools
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from itertools import combinations
 from typing import Iterable
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from .brain import Brain
-from .claim_store import ClaimStore, claims_versioning_enabled, generate_run_id
+from .claim_store import (
+    CLAIMS_CURRENT_FILE,
+    ClaimStore,
+    claims_versioning_enabled,
+    generate_run_id,
+)
 from .llm import LLMClient, get_client
 from .models import (
     ClaimTraceItem,
@@ -43,6 +50,8 @@ class BrainNotFoundError(ValueError):
 class _GlobalSynthesis(BaseModel):
     """Internal model for global synthesis pass."""
 
+    model_config = ConfigDict(defer_build=True)
+
     answer: str
     confidence: Confidence
 
@@ -50,6 +59,8 @@ class _GlobalSynthesis(BaseModel):
 class _ConflictDecision(BaseModel):
     """Internal conflict classification item."""
 
+    model_config = ConfigDict(defer_build=True)
+
     pair_id: str
     topic: str
     classification: str = Field(..., description="support|refute|ambiguous")
@@ -59,10 +70,12 @@ class _ConflictDecision(BaseModel):
 class _ConflictDecisionBatch(BaseModel):
     """Internal model for conflict batch classification."""
 
+    model_config = ConfigDict(defer_build=True)
+
     items: list[_ConflictDecision] = Field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class _InternalPerBrain:
     """Internal per-brain execution bundle with audit context."""
 
@@ -80,11 +93,21 @@ def _tokenize(text: str) -> set[str]:
     return {token for token in re.findall(r"[a-zA-Z0-9_]+", text.lower()) if len(token) >= 4}
 
 
+@functools.lru_cache(maxsize=256)
+def _has_claims_cached(brain_name: str, base_path: str, claims_mtime_ns: int) -> bool:
+    # claims_mtime_ns is part of the key so any write to the claim store invalidates it.
+    store = ClaimStore(Brain(name=brain_name, base_path=base_path))
+    return len(store.list_claims(limit=1)) > 0
+
+
 def _brain_has_claim_metadata(brain: Brain) -> bool:
     if not claims_versioning_enabled():
         return False
-    store = ClaimStore(brain)
-    return len(store.list_claims(limit=1)) > 0
+    try:
+        claims_mtime_ns = (brain.path / CLAIMS_CURRENT_FILE).stat().st_mtime_ns
+    except OSError:
+        claims_mtime_ns = -1
+    return _has_claims_cached(brain.name, str(brain.base_path), claims_mtime_ns)
 
 
 def _collect_per_brain(
@@ -221,46 +244,69 @@ def _build_conflict_candidates(
     max_pairs_per_brain_combo: int = 2,
 ) -> list[dict[str, object]]:
     candidates: list[dict[str, object]] = []
+    # Degraded brains carry no claim trace and can never form a pair.
+    with_claims = [item for item in per_brain_internal if item.claim_trace_for_conflicts]
+    # Each brain takes part in several pairs; slice its trace once up front.
+    sliced = {id(item): item.claim_trace_for_conflicts[:8] for item in with_claims}
 
-    for first, second in combinations(per_brain_internal, 2):
-        claims_a = first.claim_trace_for_conflicts[:8]
-        claims_b = second.claim_trace_for_conflicts[:8]
+    for first, second in combinations(with_claims, 2):
+        claims_a = sliced[id(first)]
+        claims_b = sliced[id(second)]
 
-        if not claims_a or not claims_b:
-            continue
+        normalized_b = [claim.claim_text.strip().lower() for claim in claims_b]
 
         scored: list[tuple[int, ClaimTraceItem, ClaimTraceItem]] = []
         for claim_a in claims_a:
             tokens_a = _tokenize(claim_a.claim_text)
-            for claim_b in claims_b:
+            normalized_a = claim_a.claim_text.strip().lower()
+            for claim_b, norm_b in zip(claims_b, normalized_b):
                 if claim_a.claim_id == claim_b.claim_id:
                     continue
                 tokens_b = _tokenize(claim_b.claim_text)
                 overlap = len(tokens_a & tokens_b)
                 if overlap < 2:
                     continue
-                if claim_a.claim_text.strip().lower() == claim_b.claim_text.strip().lower():
+                if normalized_a == norm_b:
                     continue
                 scored.append((overlap, claim_a, claim_b))
 
         scored.sort(key=lambda item: item[0], reverse=True)
-        for idx, (_, claim_a, claim_b) in enumerate(scored[:max_pairs_per_brain_combo], start=1):
-            pair_id = (
-                f"{first.result.brain_name}__{second.result.brain_name}__{idx}"
-            )
+        for _, claim_a, claim_b in scored[:max_pairs_per_brain_combo]:
             candidates.append(
                 {
-                    "pair_id": pair_id,
+                    # Sequential id doubles as the candidate's list index.
+                    "pair_id": f"P{len(candidates)}",
                     "brain_a": first.result.brain_name,
                     "brain_b": second.result.brain_name,
                     "claim_a": claim_a,
                     "claim_b": claim_b,
+                    "evidence": [
+                        f"{first.result.brain_name}:{claim_a.claim_id}",
+                        f"{second.result.brain_name}:{claim_b.claim_id}",
+                    ],
                 }
             )
 
     return candidates
 
 
+def _candidate_for_pair_id(
+    candidates: list[dict[str, object]],
+    pair_id: str,
+) -> dict[str, object] | None:
+    """Resolve an LLM-echoed pair id ("P<index>") back to its candidate."""
+    pair_id = pair_id.strip()
+    if not pair_id.startswith("P"):
+        return None
+    try:
+        index = int(pair_id[1:])
+    except ValueError:
+        return None
+    if 0 <= index < len(candidates):
+        return candidates[index]
+    return None
+
+
 def _classify_conflicts(
     *,
     question: str,
@@ -308,10 +354,9 @@ def _classify_conflicts(
     except Exception:
         return []
 
-    by_pair = {str(item["pair_id"]): item for item in candidates}
     conflicts: list[ConflictItem] = []
     for decision in decisions.items:
-        pair = by_pair.get(decision.pair_id)
+        pair = _candidate_for_pair_id(candidates, decision.pair_id)
         if not pair:
             continue
 
@@ -319,17 +364,12 @@ def _classify_conflicts(
         if normalized not in {"support", "refute", "ambiguous"}:
             normalized = "ambiguous"
 
-        claim_a = pair["claim_a"]
-        claim_b = pair["claim_b"]
         conflicts.append(
             ConflictItem(
                 topic=decision.topic or "Cross-brain claim comparison",
                 brains_involved=[str(pair["brain_a"]), str(pair["brain_b"])],
                 classification=normalized,
-                evidence=[
-                    f"{pair['brain_a']}:{claim_a.claim_id}",
-                    f"{pair['brain_b']}:{claim_b.claim_id}",
-                ],
+                evidence=list(pair["evidence"]),
             )
         )
 
@@ -337,19 +377,23 @@ def _classify_conflicts(
 
 
 def _summarize_traceability(per_brain: Iterable[PerBrainResult]) -> TraceabilitySummary:
-    per_brain_list = list(per_brain)
-    with_claims = [item for item in per_brain_list if not item.trace_degraded]
-    degraded = [item.brain_name for item in per_brain_list if item.trace_degraded]
-
-    ratio = 0.0
-    if per_brain_list:
-        ratio = round(
-            sum(item.trace_completeness_ratio for item in per_brain_list) / len(per_brain_list),
-            4,
-        )
+    total = 0
+    with_claims = 0
+    ratio_sum = 0.0
+    degraded: list[str] = []
+
+    for item in per_brain:
+        total += 1
+        ratio_sum += item.trace_completeness_ratio
+        if item.trace_degraded:
+            degraded.append(item.brain_name)
+        else:
+            with_claims += 1
+
+    ratio = round(ratio_sum / total, 4) if total else 0.0
 
     return TraceabilitySummary(
-        brains_with_claims=len(with_claims),
+        brains_with_claims=with_claims,
         brains_without_claims=len(degraded),
         overall_completeness_ratio=ratio,
         degraded_brains=degraded,
@@ -390,7 +434,9 @@ def orchestrate_multi_brain_query(
         deduped = deduped[:max_brains]
 
     brains = [Brain(name=name, base_path=brains_dir) for name in deduped]
-    missing = [brain.name for brain in brains if not brain.exists()]
+    with ThreadPoolExecutor(max_workers=min(8, len(brains))) as executor:
+        exists_flags = list(executor.map(Brain.exists, brains))
+    missing = [brain.name for brain, exists in zip(brains, exists_flags) if not exists]
     if missing:
         raise BrainNotFoundError(missing)
 
@@ -405,32 +451,32 @@ def orchestrate_multi_brain_query(
     )
     per_brain = [item.result for item in per_internal]
 
-    global_synthesis = _synthesize_global_answer(
-        question=question,
-        per_brain=per_brain,
-        client=client,
-    )
-
-    conflicts = []
-    if include_conflicts:
-        conflicts = _classify_conflicts(
+    # Synthesis and conflict classification are independent LLM calls; overlap them.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        synthesis_future = executor.submit(
+            _synthesize_global_answer,
             question=question,
-            per_brain_internal=per_internal,
+            per_brain=per_brain,
             client=client,
         )
+        conflicts_future = None
+        if include_conflicts:
+            conflicts_future = executor.submit(
+                _classify_conflicts,
+                question=question,
+                per_brain_internal=per_internal,
+                client=client,
+            )
+
+        global_synthesis = synthesis_future.result()
+        conflicts = conflicts_future.result() if conflicts_future else []
 
     if not include_claim_trace:
         for item in per_brain:
             item.claim_trace = []
             item.trace_completeness_ratio = 0.0
 
-    unique_sources: list[str] = []
-    seen_sources: set[str] = set()
-    for item in per_brain:
-        for source in item.sources:
-            if source not in seen_sources:
-                unique_sources.append(source)
-                seen_sources.add(source)
+    unique_sources = list(dict.fromkeys(source for item in per_brain for source in item.sources))
 
     run_id = generate_run_id("multiquery", "_".join(deduped[:3]))
 
@@ -1,10 +1,22 @@
 """Document parsing utilities."""
 
+import bisect
+import importlib.util
+import io
+import logging
+import multiprocessing
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+
 import fitz  # PyMuPDF
 from pathlib import Path
-from typing import Iterator
+from typing import Iterable, Iterator
 from dataclasses import dataclass
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class Chapter:
@@ -16,44 +28,163 @@ class Chapter:
     end_page: int
 
 
-def extract_text_from_pdf(pdf_path: str | Path) -> str:
+# Below this page count, process start-up costs more than it saves.
+_PARALLEL_EXTRACT_MIN_PAGES = 16
+# Each worker holds its own open document, so keep the pool small.
+_PARALLEL_EXTRACT_MAX_WORKERS = 4
+
+# Set once the missing-pypdfium2 fallback has been logged
+_pdfium_missing_warned = False
+
+# Break candidates are indexed by start offset; the lookahead keeps
+# overlapping matches (e.g. "\n\n\n") so lookups agree with str.rfind.
+_PARAGRAPH_BREAK_RE = re.compile(r"(?=\n\n)")
+_SENTENCE_BREAK_RE = re.compile(r"(?=\. )")
+
+# Chapter headings, one per line: "Chapter 3: Title", "PART 2 Title" or
+# "4. Title". Horizontal whitespace only, so a match never spans lines.
+# The lookahead rejects ordinary prose lines on their first character;
+# the conditional picks the separator rule for keyword vs numbered form.
+_CHAPTER_HEADING_RE = re.compile(
+    r"^(?=[^\S\n]*[\dcp])[^\S\n]*"
+    r"(?P<keyword>(?:chapter|part)[^\S\n]+)?(?P<num>\d+)"
+    r"(?(keyword)(?:[:.]|[^\S\n])*|\.[^\S\n]+(?=\S))"
+    r"(?P<title>.*?)[^\S\n]*$",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+
+def _last_break_before(breaks: list[int], end: int, width: int) -> int:
+    """Return the last break offset whose full match ends by ``end``, or -1."""
+    idx = bisect.bisect_right(breaks, end - width) - 1
+    return breaks[idx] if idx >= 0 else -1
+
+
+def _use_pdfium_backend() -> bool:
+    """Whether PDF_BACKEND=pdfium is set and pypdfium2 is installed."""
+    global _pdfium_missing_warned
+    if os.getenv("PDF_BACKEND", "pymupdf").strip().lower() != "pdfium":
+        return False
+    if importlib.util.find_spec("pypdfium2") is not None:
+        return True
+    if not _pdfium_missing_warned:
+        _pdfium_missing_warned = True
+        logger.warning("PDF_BACKEND=pdfium but pypdfium2 is not installed; using PyMuPDF.")
+    return False
+
+
+def _iter_pages_pdfium(pdf_path: str | Path) -> Iterator[tuple[int, str]]:
+    """Yield (page_number, text) using pypdfium2's range text extraction."""
+    import pypdfium2 as pdfium
+    
+    pdf = pdfium.PdfDocument(str(pdf_path))
+    try:
+        for i in range(len(pdf)):
+            page = pdf[i]
+            textpage = page.get_textpage()
+            try:
+                yield (i + 1, textpage.get_text_range())
+            finally:
+                textpage.close()
+                page.close()
+    finally:
+        pdf.close()
+
+
+def iter_pages(
+    pdf_path: str | Path,
+    doc: fitz.Document | None = None,
+) -> Iterator[tuple[int, str]]:
+    """
+    Lazily yield the text of each page of a PDF.
+    
+    Args:
+        pdf_path: Path to the PDF file
+        doc: Already-open document to read instead of reopening pdf_path
+        
+    Yields:
+        (page_number, text) tuples (1-indexed)
+    """
+    if doc is None:
+        if _use_pdfium_backend():
+            yield from _iter_pages_pdfium(pdf_path)
+            return
+        with fitz.open(pdf_path) as doc:
+            yield from iter_pages(pdf_path, doc)
+        return
+    for i, page in enumerate(doc):
+        yield (i + 1, page.get_text())
+
+
+def extract_text_from_pdf(
+    pdf_path: str | Path,
+    doc: fitz.Document | None = None,
+) -> str:
     """
     Extract all text from a PDF file.
     
     Args:
         pdf_path: Path to the PDF file
+        doc: Already-open document to read instead of reopening pdf_path
         
     Returns:
         Full text content
     """
-    doc = fitz.open(pdf_path)
-    text_parts = []
-    
-    for page in doc:
-        text_parts.append(page.get_text())
-    
-    doc.close()
-    return "\n".join(text_parts)
+    # Write pages straight into one buffer rather than collecting a list to join
+    buf = io.StringIO()
+    for page_num, text in iter_pages(pdf_path, doc):
+        if page_num > 1:
+            buf.write("\n")
+        buf.write(text)
+    return buf.getvalue()
 
 
-def extract_pages_from_pdf(pdf_path: str | Path) -> list[tuple[int, str]]:
+def extract_pages_from_pdf(
+    pdf_path: str | Path,
+    doc: fitz.Document | None = None,
+) -> list[tuple[int, str]]:
     """
     Extract text from each page of a PDF.
     
     Args:
         pdf_path: Path to the PDF file
+        doc: Already-open document to read instead of reopening pdf_path
         
     Returns:
         List of (page_number, text) tuples (1-indexed)
     """
-    doc = fitz.open(pdf_path)
-    pages = []
+    if doc is None:
+        if _use_pdfium_backend():
+            return list(_iter_pages_pdfium(pdf_path))
+        with fitz.open(pdf_path) as doc:
+            return extract_pages_from_pdf(pdf_path, doc)
     
-    for i, page in enumerate(doc):
-        pages.append((i + 1, page.get_text()))
+    page_count = doc.page_count
+    workers = min(os.cpu_count() or 1, _PARALLEL_EXTRACT_MAX_WORKERS, page_count)
+    if page_count < _PARALLEL_EXTRACT_MIN_PAGES or workers < 2:
+        return list(iter_pages(pdf_path, doc))
     
-    doc.close()
-    return pages
+    # Document handles can't be shared, so each worker opens its own. Spawn
+    # rather than fork: callers such as the API server run threads.
+    step = -(-page_count // workers)
+    bounds = [(lo, min(lo + step, page_count)) for lo in range(0, page_count, step)]
+    with ProcessPoolExecutor(
+        max_workers=len(bounds),
+        mp_context=multiprocessing.get_context("spawn"),
+    ) as executor:
+        ranges = executor.map(
+            _extract_page_range,
+            [str(pdf_path)] * len(bounds),
+            [lo for lo, _ in bounds],
+            [hi for _, hi in bounds],
+        )
+        return [page for pages in ranges for page in pages]
+
+
+def _extract_page_range(pdf_path: str, lo: int, hi: int) -> list[tuple[int, str]]:
+    """Extract (page_number, text) for pages [lo, hi) in a worker process."""
+    with fitz.open(pdf_path) as doc:
+        return [(i + 1, doc.load_page(i).get_text()) for i in range(lo, hi)]
 
 
 def split_into_chunks(text: str, chunk_size: int = 32000, overlap: int = 500) -> list[str]:
@@ -68,25 +199,31 @@ def split_into_chunks(text: str, chunk_size: int = 32000, overlap: int = 500) ->
     Returns:
         List of text chunks
     """
-    if len(text) <= chunk_size:
+    text_len = len(text)
+    if text_len <= chunk_size:
         return [text]
+    half_chunk = chunk_size // 2
+    
+    # Index candidate break points once instead of rescanning each window
+    para_breaks = [m.start() for m in _PARAGRAPH_BREAK_RE.finditer(text)]
+    sentence_breaks = [m.start() for m in _SENTENCE_BREAK_RE.finditer(text)]
     
     chunks = []
     start = 0
     
-    while start < len(text):
+    while start < text_len:
         end = start + chunk_size
         
         # Try to break at a paragraph or sentence
-        if end < len(text):
+        if end < text_len:
             # Look for paragraph break
-            para_break = text.rfind("\n\n", start, end)
-            if para_break > start + chunk_size // 2:
+            para_break = _last_break_before(para_breaks, end, 2)
+            if para_break > start + half_chunk:
                 end = para_break + 2
             else:
                 # Look for sentence break
-                sentence_break = text.rfind(". ", start, end)
-                if sentence_break > start + chunk_size // 2:
+                sentence_break = _last_break_before(sentence_breaks, end, 2)
+                if sentence_break > start + half_chunk:
                     end = sentence_break + 2
         
         chunks.append(text[start:end].strip())
@@ -95,6 +232,76 @@ def split_into_chunks(text: str, chunk_size: int = 32000, overlap: int = 500) ->
     return chunks
 
 
+def stream_chapters(pages: Iterable[tuple[int, str]]) -> Iterator[Chapter]:
+    """
+    Detect chapter boundaries incrementally over a stream of pages.
+    
+    Pages are treated as if joined with newlines, so the output matches
+    running detect_chapters on the full text, but only the current
+    chapter is held in memory. Each chapter's start_page is the page its
+    heading is on and end_page the last page holding its text.
+    
+    Args:
+        pages: (page_number, text) tuples in document order
+        
+    Yields:
+        Detected chapters, each as soon as the next heading is seen
+    """
+    parts: list[str] = []
+    emitted = 0
+    current_chapter_num = 0
+    current_chapter_title = "Introduction"
+    # Page the current chapter starts on, and the last page with its text
+    start_page = end_page = None
+    
+    for page_index, (page_num, page_text) in enumerate(pages):
+        if page_index:
+            parts.append("\n")
+        if start_page is None:
+            start_page = end_page = page_num
+        pos = 0
+        for match in _CHAPTER_HEADING_RE.finditer(page_text):
+            # Flush previous chapter
+            segment = page_text[pos:match.start()]
+            if segment.strip():
+                end_page = page_num
+            parts.append(segment)
+            content = "".join(parts)
+            if content:
+                yield Chapter(
+                    number=current_chapter_num,
+                    title=current_chapter_title,
+                    content=content.strip(),
+                    start_page=start_page,
+                    end_page=end_page
+                )
+                emitted += 1
+            parts = []
+            pos = match.start()
+            start_page = end_page = page_num
+            
+            # Start new chapter
+            number, title = match.group("num", "title")
+            try:
+                current_chapter_num = int(number)
+            except ValueError:
+                current_chapter_num = emitted + 1
+            current_chapter_title = title.strip() if title else f"Chapter {current_chapter_num}"
+        segment = page_text[pos:]
+        if segment.strip():
+            end_page = page_num
+        parts.append(segment)
+    
+    # Don't forget the last chapter
+    yield Chapter(
+        number=current_chapter_num,
+        title=current_chapter_title,
+        content="".join(parts).strip(),
+        start_page=start_page or 0,
+        end_page=end_page or 0
+    )
+
+
 def detect_chapters(text: str) -> list[Chapter]:
     """
     Attempt to detect chapter boundaries in text.
@@ -108,70 +315,8 @@ def detect_chapters(text: str) -> list[Chapter]:
     Returns:
         List of detected chapters
     """
-    import re
-    
-    # Common chapter patterns
-    patterns = [
-        r"^Chapter\s+(\d+)[:\.\s]*(.*?)$",
-        r"^CHAPTER\s+(\d+)[:\.\s]*(.*?)$",
-        r"^Part\s+(\d+)[:\.\s]*(.*?)$",
-        r"^PART\s+(\d+)[:\.\s]*(.*?)$",
-        r"^(\d+)\.\s+(.+)$",
-    ]
-    
-    combined_pattern = "|".join(f"({p})" for p in patterns)
-    
-    chapters = []
-    lines = text.split("\n")
-    current_chapter_start = 0
-    current_chapter_num = 0
-    current_chapter_title = "Introduction"
-    
-    for i, line in enumerate(lines):
-        line = line.strip()
-        for pattern in patterns:
-            match = re.match(pattern, line, re.IGNORECASE)
-            if match:
-                # Save previous chapter
-                if i > current_chapter_start:
-                    content = "\n".join(lines[current_chapter_start:i])
-                    chapters.append(Chapter(
-                        number=current_chapter_num,
-                        title=current_chapter_title,
-                        content=content.strip(),
-                        start_page=0,  # Would need page mapping
-                        end_page=0
-                    ))
-                
-                # Start new chapter
-                current_chapter_start = i
-                groups = match.groups()
-                current_chapter_num = int(groups[0]) if groups[0].isdigit() else len(chapters) + 1
-                current_chapter_title = groups[1].strip() if len(groups) > 1 and groups[1] else f"Chapter {current_chapter_num}"
-                break
-    
-    # Don't forget the last chapter
-    if current_chapter_start < len(lines):
-        content = "\n".join(lines[current_chapter_start:])
-        chapters.append(Chapter(
-            number=current_chapter_num,
-            title=current_chapter_title,
-            content=content.strip(),
-            start_page=0,
-            end_page=0
-        ))
-    
-    # If no chapters detected, treat whole document as one
-    if not chapters:
-        chapters.append(Chapter(
-            number=1,
-            title="Full Document",
-            content=text.strip(),
-            start_page=0,
-            end_page=0
-        ))
-    
-    return chapters
+    # Page 0: the page layout of raw text is unknown
+    return list(stream_chapters([(0, text)]))
 
 
 def chunk_document(
@@ -190,23 +335,22 @@ def chunk_document(
     Yields:
         (chunk_number, chunk_title, chunk_content) tuples
     """
-    text = extract_text_from_pdf(pdf_path)
-    
-    if use_chapters:
-        chapters = detect_chapters(text)
-        for chapter in chapters:
-            # If chapter is too long, split it
-            if len(chapter.content) > chunk_size * 1.5:
-                sub_chunks = split_into_chunks(chapter.content, chunk_size)
-                for i, sub_chunk in enumerate(sub_chunks):
-                    yield (
-                        chapter.number,
-                        f"{chapter.title} (Part {i+1})",
-                        sub_chunk
-                    )
-            else:
-                yield (chapter.number, chapter.title, chapter.content)
-    else:
-        chunks = split_into_chunks(text, chunk_size)
-        for i, chunk in enumerate(chunks):
-            yield (i + 1, f"Chunk {i + 1}", chunk)
+    # With the pdfium backend, the helpers open the file themselves
+    with nullcontext() if _use_pdfium_backend() else fitz.open(pdf_path) as doc:
+        if use_chapters:
+            for chapter in stream_chapters(iter_pages(pdf_path, doc)):
+                # If chapter is too long, split it
+                if len(chapter.content) > chunk_size * 1.5:
+                    sub_chunks = split_into_chunks(chapter.content, chunk_size)
+                    for i, sub_chunk in enumerate(sub_chunks):
+                        yield (
+                            chapter.number,
+                            f"{chapter.title} (Part {i+1})",
+                            sub_chunk
+                        )
+                else:
+                    yield (chapter.number, chapter.title, chapter.content)
+        else:
+            chunks = split_into_chunks(extract_text_from_pdf(pdf_path, doc), chunk_size)
+            for i, chunk in enumerate(chunks):
+                yield (i + 1, f"Chunk {i + 1}", chunk)
@@ -4,9 +4,13 @@ Decouples the 'reading' of chapters from the 'processing' logic,
 allowing for different strategies like skipping irrelevant chapters.
 """
 
+import re
 from abc import ABC, abstractmethod
+from collections import Counter
+from functools import lru_cache
 from typing import Optional
 from datetime import datetime
+from pydantic import BaseModel, Field
 from rich.console import Console
 
 from .brain import Brain
@@ -17,9 +21,73 @@ from .agent import run_extraction_agent
 
 console = Console()
 
+# Chapters per batched triage call, and the preview sent for each one
+TRIAGE_BATCH_SIZE = 40
+TRIAGE_PREVIEW_CHARS = 500
+
+# Keyword pre-filter: distinct objective terms (3+ characters, no stopwords,
+# compared after stripping simple suffixes) found in the first
+# TRIAGE_SCAN_CHARS of a chapter. None found skips the chapter; all of them,
+# or TRIAGE_RELEVANT_HITS for long objectives, processes it; anything in
+# between goes to the LLM. A keyword skip records the chapter's TRIAGE_REASON_TERMS most
+# frequent terms as its reason so later gap detection has content to match.
+TRIAGE_SCAN_CHARS = 10000
+TRIAGE_RELEVANT_HITS = 20
+TRIAGE_REASON_TERMS = 12
+_MIN_TERM_CHARS = 3
+_WORD_RE = re.compile(r"\w+")
+_STOPWORDS = frozenset({
+    "a", "about", "all", "an", "and", "are", "as", "at", "be", "book", "by",
+    "can", "do", "does", "for", "from", "how", "i", "in", "is", "it", "me",
+    "my", "of", "on", "or", "that", "the", "this", "to", "understand", "what",
+    "when", "where", "which", "who", "why", "with",
+})
+
+
+@lru_cache(maxsize=8192)
+def _term_stem(word: str) -> str:
+    """Strip a plural or verb suffix so "engines"/"engine" and "burned"/"burns" match."""
+    if word.endswith("ies") and len(word) > 4:
+        return word[:-3] + "y"
+    for suffix in ("ing", "ed", "es", "s"):
+        if word.endswith(suffix) and not word.endswith("ss") and len(word) - len(suffix) >= _MIN_TERM_CHARS:
+            word = word[:-len(suffix)]
+            break
+    if word.endswith("e") and len(word) > _MIN_TERM_CHARS:
+        word = word[:-1]
+    return word
+
+
+class TriageDecision(BaseModel):
+    is_relevant: bool = Field(..., description="Whether this chapter contains information relevant to the objective.")
+    reasoning: str = Field(..., description="Brief reason for the decision.")
+
+
+class ChapterTriageDecision(TriageDecision):
+    chapter_num: int = Field(..., description="Chapter number this decision applies to.")
+
+
+class BatchTriageDecision(BaseModel):
+    decisions: list[ChapterTriageDecision] = Field(default_factory=list)
+
+
 class IngestionStrategy(ABC):
     """Abstract base class for ingestion strategies."""
     
+    def prepare(
+        self,
+        chapters: list[tuple[int, str, str]],
+        client: LLMClient,
+        objective: Optional[str] = None,
+    ) -> None:
+        """
+        Optional pre-pass over the chapters about to be processed.
+        
+        Args:
+            chapters: (chapter_num, chapter_title, chapter_content) tuples
+        """
+        return None
+    
     @abstractmethod
     def process_chapter(
         self,
@@ -100,6 +168,94 @@ class TriageStrategy(IngestionStrategy):
     
     def __init__(self):
         self.standard_strategy = StandardStrategy()
+        self._decisions: dict[int, TriageDecision] = {}
+        self._objective: str | None = None
+        self._objective_terms: frozenset[str] = frozenset()
+    
+    def _keyword_decision(self, chapter_content: str, objective: str) -> TriageDecision | None:
+        """Decide obvious cases from objective-term overlap, or None if ambiguous."""
+        if objective != self._objective:
+            self._objective = objective
+            self._objective_terms = frozenset(
+                _term_stem(w) for w in _WORD_RE.findall(objective.lower())
+                if len(w) >= _MIN_TERM_CHARS and w not in _STOPWORDS
+            )
+        terms = self._objective_terms
+        if not terms:
+            return None
+        
+        words = _WORD_RE.findall(chapter_content[:TRIAGE_SCAN_CHARS].lower())
+        hits = len(terms.intersection(map(_term_stem, words)))
+        if hits == 0:
+            topics = Counter(
+                w for w in words if len(w) >= _MIN_TERM_CHARS and w not in _STOPWORDS and not w.isdigit()
+            )
+            top_terms = ", ".join(w for w, _ in topics.most_common(TRIAGE_REASON_TERMS))
+            reasoning = f"Off-objective; covers {top_terms}" if top_terms else "Off-objective; no readable text"
+            return TriageDecision(is_relevant=False, reasoning=reasoning)
+        if hits >= min(TRIAGE_RELEVANT_HITS, len(terms)):
+            return TriageDecision(is_relevant=True, reasoning=f"{hits} objective terms present")
+        return None
+    
+    def prepare(
+        self,
+        chapters: list[tuple[int, str, str]],
+        client: LLMClient,
+        objective: Optional[str] = None,
+    ) -> None:
+        """Triage chapters in batches so each chapter doesn't cost a round trip."""
+        self._decisions = {}
+        if not objective or not chapters:
+            return
+        
+        ambiguous = []
+        for num, title, content in chapters:
+            decision = self._keyword_decision(content, objective)
+            if decision is None:
+                ambiguous.append((num, title, content))
+            else:
+                self._decisions[num] = decision
+        chapters = ambiguous
+        if not chapters:
+            return
+        
+        console.print(f"  [dim]Triaging {len(chapters)} chapters in batches...[/dim]")
+        system_prompt = "You are a content filter. Decide for each chapter if it is relevant to the user's objective."
+        for start in range(0, len(chapters), TRIAGE_BATCH_SIZE):
+            batch = chapters[start:start + TRIAGE_BATCH_SIZE]
+            previews = "\n\n".join(
+                f"### Chapter {num}: {title}\n{content[:TRIAGE_PREVIEW_CHARS]} ... (truncated)"
+                for num, title, content in batch
+            )
+            user_prompt = f"""## User Objective
+{objective}
+
+## Chapter Previews
+{previews}
+
+---
+
+For each chapter above, return a decision with its chapter_num. Mark it relevant if it may contain ANY potentially useful information. Mark it irrelevant only if it is completely irrelevant.
+"""
+            try:
+                result = client.generate(
+                    response_model=BatchTriageDecision,
+                    system_prompt=system_prompt,
+                    user_prompt=user_prompt,
+                    temperature=0.0
+                )
+            except Exception as e:
+                # Chapters without a batched decision are triaged individually
+                console.print(f"[yellow]Batch triage failed, falling back to per-chapter triage: {e}[/yellow]")
+                continue
+            
+            batch_nums = {num for num, _, _ in batch}
+            for item in result.decisions:
+                if item.chapter_num in batch_nums:
+                    self._decisions[item.chapter_num] = TriageDecision(
+                        is_relevant=item.is_relevant,
+                        reasoning=item.reasoning,
+                    )
         
     def process_chapter(
         self,
@@ -118,15 +274,37 @@ class TriageStrategy(IngestionStrategy):
                 chapter_content, chapter_title, chapter_num, brain, client, objective, fast_mode, run_id
             )
             
+        decision = self._decisions.pop(chapter_num, None)
+        if decision is None:
+            decision = self._keyword_decision(chapter_content, objective)
+        if decision is None:
+            decision = self._triage_chapter(chapter_content, chapter_title, client, objective)
+
+        if decision.is_relevant:
+            console.print(f"  [green]Relevant:[/green] {decision.reasoning}")
+            # Delegate to Standard Strategy
+            return self.standard_strategy.process_chapter(
+                chapter_content, chapter_title, chapter_num, brain, client, objective, fast_mode, run_id
+            )
+        else:
+            console.print(f"  [yellow]Skipped:[/yellow] {decision.reasoning}")
+            return ChapterState(
+                chapter_num=chapter_num,
+                status=ChapterStatus.SKIPPED,
+                reason=decision.reasoning,
+                timestamp=datetime.now().isoformat()
+            )
+
+    def _triage_chapter(
+        self,
+        chapter_content: str,
+        chapter_title: str,
+        client: LLMClient,
+        objective: str,
+    ) -> TriageDecision:
         # Triage Step
         console.print("  [dim]Triaging chapter relevance...[/dim]")
         
-        from pydantic import BaseModel, Field
-        
-        class TriageDecision(BaseModel):
-            is_relevant: bool = Field(..., description="Whether this chapter contains information relevant to the objective.")
-            reasoning: str = Field(..., description="Brief reason for the decision.")
-            
         system_prompt = "You are a content filter. Decide if the text is relevant to the user's objective."
         user_prompt = f"""## User Objective
 {objective}
@@ -139,7 +317,7 @@ class TriageStrategy(IngestionStrategy):
 Is this chapter relevant to the objective? Reply YES if it contains ANY potentially useful information. Reply NO only if it is completely irrelevant.
 """
         try:
-            decision = client.generate(
+            return client.generate(
                 response_model=TriageDecision,
                 system_prompt=system_prompt,
                 user_prompt=user_prompt,
@@ -147,22 +325,7 @@ Is this chapter relevant to the objective? Reply YES if it contains ANY potentia
             )
         except Exception as e:
             console.print(f"[yellow]Triage failed, failing open (processing): {e}[/yellow]")
-            decision = TriageDecision(is_relevant=True, reasoning="Error in triage")
-
-        if decision.is_relevant:
-            console.print(f"  [green]Relevant:[/green] {decision.reasoning}")
-            # Delegate to Standard Strategy
-            return self.standard_strategy.process_chapter(
-                chapter_content, chapter_title, chapter_num, brain, client, objective, fast_mode, run_id
-            )
-        else:
-            console.print(f"  [yellow]Skipped:[/yellow] {decision.reasoning}")
-            return ChapterState(
-                chapter_num=chapter_num,
-                status=ChapterStatus.SKIPPED,
-                reason=decision.reasoning,
-                timestamp=datetime.now().isoformat()
-            )
+            return TriageDecision(is_relevant=True, reasoning="Error in triage")
 
 def get_strategy(name: str) -> IngestionStrategy:
     if name.lower() == "triage":
@@ -1,15 +1,19 @@
 """Prompt management for Cognitive Book OS."""
 
+import re
 from pathlib import Path
 from typing import Optional
-from functools import lru_cache
+from functools import cache
 
 
 # Prompts directory
 PROMPTS_DIR = Path(__file__).parent / "prompts"
 
+# {variable} placeholders substituted by get_prompt_with_context
+_PLACEHOLDER_RE = re.compile(r"\{(\w+)\}")
 
-@lru_cache(maxsize=10)
+
+@cache
 def load_prompt(name: str) -> str:
     """
     Load a prompt template by name.
@@ -24,9 +28,10 @@ def load_prompt(name: str) -> str:
         FileNotFoundError: If prompt file doesn't exist
     """
     prompt_path = PROMPTS_DIR / f"{name}.md"
-    if not prompt_path.exists():
-        raise FileNotFoundError(f"Prompt not found: {prompt_path}")
-    return prompt_path.read_text(encoding="utf-8")
+    try:
+        return prompt_path.read_bytes().decode("utf-8")
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Prompt not found: {prompt_path}") from None
 
 
 def get_extract_prompt() -> str:
@@ -82,9 +87,13 @@ def get_prompt_with_context(
         Prompt with context substituted
     """
     prompt = load_prompt(prompt_name)
-    for key, value in context.items():
-        prompt = prompt.replace(f"{{{key}}}", value)
-    return prompt
+    if not context:
+        return prompt
+    # One pass; unknown placeholders are left as-is
+    return _PLACEHOLDER_RE.sub(
+        lambda match: context.get(match.group(1), match.group(0)),
+        prompt,
+    )
 
 
 def get_system_prompt(name: str) -> str:
@@ -1,7 +1,16 @@
 """Query system - answer questions using the brain."""
 
+import contextlib
+import math
+import re
+from collections import Counter, OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
+from threading import Lock
+from typing import Any, Callable, Iterator
 from rich.console import Console
+from rich.live import Live
+from rich.text import Text
 
 from .brain import Brain
 from .claim_store import ClaimStore, claims_versioning_enabled, generate_run_id
@@ -9,9 +18,27 @@ from .llm import LLMClient, get_client
 from .models import FileSelection, QueryResult, QueryAuditResult, Confidence
 from .enrichment import EnrichmentManager
 from .prompts import get_system_prompt
+from .query_cache import QueryCache, query_cache_enabled
 
 console = Console()
 
+# Brains at or under these sizes are answered in one call (see answer_one_shot)
+ONE_SHOT_MAX_FILES = 200
+ONE_SHOT_MAX_CHARS = 48000
+
+# Recently selected files per brain path, prefetched during the next selection
+HOT_FILES_MAX = 16
+_hot_files: dict[str, OrderedDict[str, None]] = {}
+_hot_files_lock = Lock()
+
+# Character budget for file contents in the answer prompt (~30k tokens)
+ANSWER_CONTEXT_MAX_CHARS = 120000
+
+# Graph-linked files kept in the answer prompt, best TF-IDF match first
+ANSWER_MAX_LINKED_FILES = 12
+
+_TERM_RE = re.compile(r"\w+")
+
 from langfuse import observe
 
 @observe(name="Query Brain")
@@ -51,23 +78,46 @@ def query_brain(
     console.print(f"Question: {question}")
     console.print()
     
-    # Step 1: Select relevant files
-    console.print("[dim]Selecting relevant files...[/dim]")
-    selection = select_relevant_files(question, brain, client)
+    # Reuse a prior answer if the brain hasn't changed since
+    cache = QueryCache(brain) if query_cache_enabled() else None
+    if cache:
+        cached = cache.lookup(question, client.provider, client.model)
+        if cached:
+            console.print("[dim]Answered from query cache.[/dim]")
+            _print_result(cached)
+            return cached.answer
     
-    console.print(f"[dim]Selected {len(selection.files)} files:[/dim]")
-    for f in selection.files:
-        console.print(f"  - {f}")
-    console.print()
-
-    if not selection.files and not auto_enrich:
-        return "I couldn't find any relevant information in the brain."
+    # Small brains fit in one prompt: answer without a selection round trip
+    all_files = brain.list_files()
+    selected_files: list[str] = []
+    with _live_answer() as on_partial:
+        result = answer_one_shot(question, brain, client, all_files=all_files, on_partial=on_partial)
+    if result is not None:
+        console.print("[dim]Answered from the full brain in one pass.[/dim]")
+    else:
+        # Step 1: Select relevant files (recently used files load meanwhile)
+        console.print("[dim]Selecting relevant files...[/dim]")
+        prefetch = _prefetch_hot_files(brain)
+        selection = select_relevant_files(question, brain, client, all_files=all_files)
+        selected_files = selection.files
         
-    # Step 2: Generate answer
-    result = None
-    if selection.files:
-        console.print("[dim]Generating answer...[/dim]")
-        result = answer_from_brain(question, brain, selection.files, client)
+        console.print(f"[dim]Selected {len(selection.files)} files:[/dim]")
+        for f in selection.files:
+            console.print(f"  - {f}")
+        console.print()
+
+        if not selection.files and not auto_enrich:
+            return "I couldn't find any relevant information in the brain."
+            
+        # Step 2: Generate answer
+        if selection.files:
+            console.print("[dim]Generating answer...[/dim]")
+            with _live_answer() as on_partial:
+                result = answer_from_brain(
+                    question, brain, selection.files, client,
+                    all_files=all_files, prefetched=_collect_prefetch(prefetch),
+                    on_partial=on_partial,
+                )
     
     # Active Learning / Auto-Enrichment Loop
     # Trigger if no files found OR low confidence
@@ -77,6 +127,8 @@ def query_brain(
     if auto_enrich and current_confidence in [Confidence.LOW, Confidence.NONE]:
         console.print("[dim]Low confidence answer. Checking skipped chapters (Active Learning)...[/dim]")
         
+        # Only now, with confidence known: the literal pass is free, but the
+        # LLM pass behind it is a paid call that confident answers never need
         manager = EnrichmentManager(brain_name, brains_dir)
         should_enrich, chapters = manager.evaluate_gap(question, provider, model)
         
@@ -99,34 +151,49 @@ def query_brain(
             
             if proceed:
                 console.print("[bold cyan]Triggering Auto-Enrichment...[/bold cyan]")
-                manager.enrich(question, provider, model)
+                new_files = manager.enrich(question, provider, model)
                 processed_enrichment = True
                 
-                # Re-Index (implicit in file system) & Re-Select
+                # Re-Index (implicit in file system). The earlier selection is
+                # still valid, so only the files enrichment wrote are added.
                 console.print("[bold blue]Retrying query with expanded knowledge base...[/bold blue]")
-                selection = select_relevant_files(question, brain, client)
-                if selection.files:
-                    result = answer_from_brain(question, brain, selection.files, client)
+                all_files = brain.list_files()
+                retry = answer_one_shot(question, brain, client, all_files=all_files)
+                if retry is None:
+                    retry_files = list(dict.fromkeys(selected_files + new_files))
+                    if not retry_files:
+                        retry_files = select_relevant_files(question, brain, client, all_files=all_files).files
+                    if retry_files:
+                        retry = answer_from_brain(question, brain, retry_files, client, all_files=all_files)
+                if retry is not None:
+                    result = retry
         else:
              console.print("[dim]Gap Detector: Skipped chapters are unlikely to contain the answer.[/dim]")
 
     if result is None:
         return "I couldn't find any relevant information in the brain, even after checking skipped chapters."
+    
+    if cache:
+        cache.store(question, client.provider, client.model, result)
         
+    _print_result(result)
+    return result.answer
+
+
+def _print_result(result: QueryResult) -> None:
     console.print()
     console.print("[bold]Answer:[/bold]")
     console.print(result.answer)
     console.print()
     console.print(f"[dim]Confidence: {result.confidence.value}[/dim]")
     console.print(f"[dim]Sources: {', '.join(result.sources)}[/dim]")
-    
-    return result.answer
 
 
 def select_relevant_files(
     question: str,
     brain: Brain,
-    client: LLMClient
+    client: LLMClient,
+    all_files: list[str] | None = None,
 ) -> FileSelection:
     """
     Use LLM to select which brain files are relevant to the question.
@@ -135,6 +202,7 @@ def select_relevant_files(
         question: The user's question
         brain: The brain to query
         client: LLM client
+        all_files: Pre-fetched brain.list_files() result, if the caller has one
         
     Returns:
         FileSelection with relevant file paths
@@ -148,8 +216,8 @@ select which files would be most relevant to answer the question.
 
 You can select up to 15 files."""
 
-    brain_structure = brain.get_structure()
-    all_files = brain.list_files()
+    if all_files is None:
+        all_files = brain.list_files()
     
     # Group files by directory for better context
     files_by_dir: dict[str, list[str]] = {}
@@ -165,12 +233,14 @@ You can select up to 15 files."""
         for f in files:
             file_list += f"- {f}\n"
     
+    # File listing first: it is identical across questions, so providers
+    # can reuse the cached prefix and only process the question
+    files_block = f"""## Available Files
+{file_list}
+"""
     user_prompt = f"""## Question
 {question}
 
-## Available Files
-{file_list}
-
 Which files should I read to answer this question?
 """
 
@@ -178,14 +248,56 @@ Which files should I read to answer this question?
         response_model=FileSelection,
         system_prompt=system_prompt,
         user_prompt=user_prompt,
-        temperature=0.3
+        temperature=0.3,
+        cached_prefix=files_block,
     )
 
 
+def _read_files(brain: Brain, file_paths: list[str]) -> list[str | None]:
+    """Read several brain files concurrently, preserving order."""
+    if len(file_paths) < 2:
+        return [brain.read_file(file_path) for file_path in file_paths]
+    with ThreadPoolExecutor(max_workers=min(8, len(file_paths))) as executor:
+        return list(executor.map(brain.read_file, file_paths))
+
+
+def _remember_hot_files(brain: Brain, file_paths: list[str]) -> None:
+    with _hot_files_lock:
+        hot = _hot_files.setdefault(str(brain.path), OrderedDict())
+        for file_path in file_paths:
+            hot[file_path] = None
+            hot.move_to_end(file_path)
+        while len(hot) > HOT_FILES_MAX:
+            hot.popitem(last=False)
+
+
+def _prefetch_hot_files(brain: Brain) -> Future | None:
+    """Start reading recently selected files in the background, if any."""
+    with _hot_files_lock:
+        hot = list(_hot_files.get(str(brain.path), ()))
+    if not hot:
+        return None
+    executor = ThreadPoolExecutor(max_workers=1)
+    future = executor.submit(lambda: dict(zip(hot, _read_files(brain, hot))))
+    executor.shutdown(wait=False)
+    return future
+
+
+def _collect_prefetch(future: Future | None) -> dict[str, str | None] | None:
+    if future is None:
+        return None
+    try:
+        return future.result()
+    except Exception:
+        # Prefetch is best-effort; the answer path reads what it needs
+        return None
+
+
 def expand_selection_with_graph(
     brain: Brain,
     initial_files: list[str],
-    max_depth: int = 1
+    max_depth: int = 1,
+    all_files: list[str] | None = None,
 ) -> list[str]:
     """
     Expand the initial file selection by following 'related' links in the knowledge graph.
@@ -194,19 +306,53 @@ def expand_selection_with_graph(
         brain: The brain
         initial_files: List of file paths selected by the LLM
         max_depth: How many hops to follow (default 1 to prevent explosion)
+        all_files: Pre-fetched brain.list_files() result, if the caller has one
         
     Returns:
-        Expanded list of file paths (unique)
+        Expanded list of file paths (unique), selected files first and then
+        linked files in the order they were discovered
+    """
+    expanded_files, _ = _expand_selection(brain, initial_files, max_depth, all_files)
+    return expanded_files
+
+
+def _expand_selection(
+    brain: Brain,
+    initial_files: list[str],
+    max_depth: int,
+    all_files: list[str] | None,
+    prefetched: dict[str, str | None] | None = None,
+) -> tuple[list[str], dict[str, str | None]]:
+    """
+    Graph expansion that also returns the contents it read along the way,
+    so callers can reuse them instead of reading the same files twice.
     """
     from .viz import extract_related_links  # Reuse parser
     
-    expanded = set(initial_files)
-    frontier = list(initial_files)
+    contents_by_path: dict[str, str | None] = dict(prefetched) if prefetched else {}
+    # Insertion-ordered: selected files first, then links in BFS discovery order
+    expanded = dict.fromkeys(initial_files)
+    frontier = list(expanded)
+    
+    # Index brain files once: exact paths, plus first position per name/stem
+    # so partial links resolve like a linear scan would
+    if all_files is None:
+        all_files = brain.list_files()
+    all_files_set = set(all_files)
+    first_by_name: dict[str, int] = {}
+    first_by_stem: dict[str, int] = {}
+    for idx, f in enumerate(all_files):
+        path = Path(f)
+        first_by_name.setdefault(path.name, idx)
+        first_by_stem.setdefault(path.stem, idx)
+    resolved_partials: dict[str, str | None] = {}
     
     for _ in range(max_depth):
         new_frontier = []
+        unread = [f for f in frontier if f not in contents_by_path]
+        contents_by_path.update(zip(unread, _read_files(brain, unread)))
         for file_path in frontier:
-            content = brain.read_file(file_path)
+            content = contents_by_path[file_path]
             if not content:
                 continue
                 
@@ -216,36 +362,41 @@ def expand_selection_with_graph(
             # Resolve and add links
             # We need a way to resolve paths similar to viz.py if they are partial
             # But for now assume agent follows instruction to put full paths or relative valid paths
-            all_files = brain.list_files()
-            
             for link in links:
                 # Basic resolution: check if exists, or check if matches stem
-                if link in all_files:
-                    if link not in expanded:
-                        expanded.add(link)
-                        new_frontier.append(link)
+                if link in all_files_set:
+                    f = link
+                elif link in resolved_partials:
+                    f = resolved_partials[link]
                 else:
-                    # Try to match partials
-                    # (Simple linear scan for robustness)
-                    for f in all_files:
-                        if Path(f).name == Path(link).name or Path(f).stem == Path(link).stem:
-                            if f not in expanded:
-                                expanded.add(f)
-                                new_frontier.append(f)
-                            break
+                    # Try to match partials (once per distinct link text)
+                    link_path = Path(link)
+                    matches = [
+                        idx
+                        for idx in (first_by_name.get(link_path.name), first_by_stem.get(link_path.stem))
+                        if idx is not None
+                    ]
+                    f = all_files[min(matches)] if matches else None
+                    resolved_partials[link] = f
+                if f is not None and f not in expanded:
+                    expanded[f] = None
+                    new_frontier.append(f)
                             
         frontier = new_frontier
         if not frontier:
             break
             
-    return sorted(list(expanded))
+    return list(expanded), contents_by_path
 
 
 def answer_from_brain(
     question: str,
     brain: Brain,
     selected_files: list[str],
-    client: LLMClient
+    client: LLMClient,
+    all_files: list[str] | None = None,
+    prefetched: dict[str, str | None] | None = None,
+    on_partial: Callable[[Any], None] | None = None,
 ) -> QueryResult:
     """
     Generate an answer using the selected brain files.
@@ -255,11 +406,18 @@ def answer_from_brain(
         brain: The brain
         selected_files: Files to read
         client: LLM client
+        all_files: Pre-fetched brain.list_files() result, if the caller has one
+        prefetched: Already-read {path: content} to use instead of disk reads
+        on_partial: Called with partial results while the answer streams
         
     Returns:
         QueryResult with the answer
     """
-    result, _ = _generate_answer_from_selection(question, brain, selected_files, client)
+    result, _ = _generate_answer_from_selection(
+        question, brain, selected_files, client,
+        all_files=all_files, prefetched=prefetched, on_partial=on_partial,
+    )
+    _remember_hot_files(brain, selected_files)
     return result
 
 
@@ -273,7 +431,7 @@ def answer_from_brain_with_audit(
     """
     Generate an answer and attach claim-level traceability metadata.
     """
-    result, expanded_files = _generate_answer_from_selection(question, brain, selected_files, client)
+    result, context_files = _generate_answer_from_selection(question, brain, selected_files, client)
     claim_store = ClaimStore(brain)
     audit_run_id = run_id or generate_run_id("query", brain.name)
 
@@ -283,14 +441,14 @@ def answer_from_brain_with_audit(
             objective=question,
             provider=client.provider,
             model=client.model,
-            metadata={"selected_files": selected_files, "expanded_files": expanded_files},
+            metadata={"selected_files": selected_files, "expanded_files": context_files},
         )
 
     try:
         audit_result = claim_store.build_query_audit(
             question=question,
             result=result,
-            default_sources=expanded_files,
+            default_sources=context_files,
             run_id=audit_run_id,
         )
     except Exception:
@@ -318,39 +476,134 @@ def _generate_answer_from_selection(
     brain: Brain,
     selected_files: list[str],
     client: LLMClient,
+    all_files: list[str] | None = None,
+    prefetched: dict[str, str | None] | None = None,
+    on_partial: Callable[[Any], None] | None = None,
 ) -> tuple[QueryResult, list[str]]:
     """
-    Generate a query answer and return the expanded file set used for context.
+    Generate a query answer and return the files whose content went into its context.
     """
     # Expand selection using Knowledge Graph
-    expanded_files = expand_selection_with_graph(brain, selected_files)
+    expanded_files, contents_by_path = _expand_selection(
+        brain, selected_files, 1, all_files, prefetched
+    )
     
-    if len(expanded_files) > len(selected_files):
-        console.print(f"[dim]Graph expansion added {len(expanded_files) - len(selected_files)} related files[/dim]")
+    # Split by membership: selected_files may repeat paths that expansion de-duplicated
+    selected_set = set(selected_files)
+    linked_files = [f for f in expanded_files if f not in selected_set]
+    if linked_files:
+        console.print(f"[dim]Graph expansion added {len(linked_files)} related files[/dim]")
         
     system_prompt = get_system_prompt("query")
     
     # Read the selected files
-    file_contents = ""
-    for file_path in expanded_files:
-        content = brain.read_file(file_path)
+    # Files read during expansion are reused; only newly linked ones hit disk
+    unread = [f for f in expanded_files if f not in contents_by_path]
+    contents_by_path.update(zip(unread, _read_files(brain, unread)))
+    
+    # Selected files always go in; linked files only if they match the question
+    if len(linked_files) > ANSWER_MAX_LINKED_FILES:
+        scores = _tfidf_scores(question, [contents_by_path[f] or "" for f in linked_files])
+        ranked = sorted(range(len(linked_files)), key=lambda i: -scores[i])
+        linked_files = [linked_files[i] for i in ranked[:ANSWER_MAX_LINKED_FILES]]
+        expanded_files = [f for f in expanded_files if f in selected_set] + linked_files
+        console.print(f"[dim]Kept the {ANSWER_MAX_LINKED_FILES} linked files closest to the question[/dim]")
+    
+    parts: list[str] = []
+    included_files: list[str] = []
+    total_chars = 0
+    for idx, file_path in enumerate(expanded_files):
+        content = contents_by_path[file_path]
         if content:
-            file_contents += f"\n### {file_path}\n{content}\n"
+            if parts and total_chars + len(content) > ANSWER_CONTEXT_MAX_CHARS:
+                # Files are in priority order (selected, then linked), so everything
+                # from here on is left out, selected files included
+                console.print(f"[dim]Context budget reached; left out {len(expanded_files) - idx} files[/dim]")
+                break
+            part = f"\n### {file_path}\n{content}\n"
+            parts.append(part)
+            included_files.append(file_path)
+            total_chars += len(part)
     
     # Also include the objective response for context
     response = brain.get_response()
+    context_block, question_prompt = _build_answer_prompt(question, "".join(parts), response)
+
+    # Not sent as cached_prefix: the selected files change with each question,
+    # so an explicit cache write would rarely be read back
+    result = client.generate(
+        response_model=QueryResult,
+        system_prompt=system_prompt,
+        user_prompt=context_block + question_prompt,
+        temperature=0.5,
+        **_stream_kwargs(on_partial),
+    )
+    return result, included_files
+
+
+def _tfidf_scores(question: str, documents: list[str]) -> list[float]:
+    """Cosine similarity of each document to the question over TF-IDF vectors."""
+    doc_counts = [Counter(_TERM_RE.findall(doc.lower())) for doc in documents]
+    doc_freq: Counter[str] = Counter()
+    for counts in doc_counts:
+        doc_freq.update(counts.keys())
+    
+    n_docs = len(documents)
+    idf = {term: math.log((1 + n_docs) / (1 + df)) + 1 for term, df in doc_freq.items()}
+    query_vec = {
+        term: count * idf[term]
+        for term, count in Counter(_TERM_RE.findall(question.lower())).items()
+        if term in idf
+    }
+    query_norm = math.sqrt(sum(w * w for w in query_vec.values()))
+    if not query_norm:
+        return [0.0] * n_docs
     
+    scores = []
+    for counts in doc_counts:
+        dot = sum(w * counts[term] * idf[term] for term, w in query_vec.items() if term in counts)
+        if not dot:
+            scores.append(0.0)
+            continue
+        doc_norm = math.sqrt(sum((count * idf[term]) ** 2 for term, count in counts.items()))
+        scores.append(dot / (query_norm * doc_norm))
+    return scores
 
-    user_prompt = f"""## Question
-{question}
 
-## Relevant Knowledge Base Files
+def _stream_kwargs(on_partial: Callable[[Any], None] | None) -> dict[str, Any]:
+    # Only pass the callback when set, so plain generate() implementations work
+    return {"on_partial": on_partial} if on_partial is not None else {}
+
+
+@contextlib.contextmanager
+def _live_answer() -> Iterator[Callable[[Any], None]]:
+    """Show the answer text while it streams; cleared once the call returns."""
+    with Live(console=console, refresh_per_second=8, transient=True) as live:
+        def update(partial: Any) -> None:
+            answer = getattr(partial, "answer", None)
+            if answer:
+                live.update(Text(answer))
+        yield update
+
+
+def _build_answer_prompt(question: str, file_contents: str, response: str) -> tuple[str, str]:
+    """
+    Split the answer prompt into (context block, question prompt).
+
+    The context block does not depend on the question. answer_one_shot sends
+    it as a cached prefix because the whole-brain context repeats across
+    questions; selection-based answers send both parts as one prompt.
+    """
+    context_block = f"""## Relevant Knowledge Base Files
 {file_contents}
 
 ## Original Objective Response (for context)
 {response}
+"""
+    return context_block, f"""---
 
----
+## Question
+{question}
 
 ## Instructions
 1. **Answer the question** using the provided files.
@@ -362,15 +615,70 @@ def _generate_answer_from_selection(
 Answer:
 """
 
-    result = client.generate(
+
+def answer_one_shot(
+    question: str,
+    brain: Brain,
+    client: LLMClient,
+    all_files: list[str] | None = None,
+    on_partial: Callable[[Any], None] | None = None,
+) -> QueryResult | None:
+    """
+    Answer from the whole brain in a single LLM call, skipping file selection.
+    
+    Only small brains qualify: if the knowledge files (excluding `meta/` and
+    `_`-prefixed files) exceed ONE_SHOT_MAX_FILES or ONE_SHOT_MAX_CHARS,
+    returns None and the caller should use the select-then-answer path.
+    
+    Args:
+        question: The user's question
+        brain: The brain
+        client: LLM client
+        all_files: Pre-fetched brain.list_files() result, if the caller has one
+        on_partial: Called with partial results while the answer streams
+        
+    Returns:
+        QueryResult, or None if the brain is too large for one call
+    """
+    if all_files is None:
+        all_files = brain.list_files()
+    knowledge_files = [
+        f for f in all_files if not f.startswith("meta/") and not f.startswith("_")
+    ]
+    if not knowledge_files or len(knowledge_files) > ONE_SHOT_MAX_FILES:
+        return None
+    
+    # Size the brain from file metadata before reading anything. Bytes on disk
+    # are never fewer than characters, so this only ever errs toward the
+    # select-then-answer path.
+    total_bytes = 0
+    for file_path in knowledge_files:
+        try:
+            total_bytes += (brain.path / file_path).stat().st_size
+        except OSError:
+            continue
+        if total_bytes > ONE_SHOT_MAX_CHARS:
+            return None
+    
+    parts: list[str] = []
+    total_chars = 0
+    for file_path, content in zip(knowledge_files, _read_files(brain, knowledge_files)):
+        if content:
+            part = f"\n### {file_path}\n{content}\n"
+            parts.append(part)
+            total_chars += len(part)
+            if total_chars > ONE_SHOT_MAX_CHARS:
+                return None
+    
+    context_block, user_prompt = _build_answer_prompt(question, "".join(parts), brain.get_response())
+    return client.generate(
         response_model=QueryResult,
-        system_prompt=system_prompt,
+        system_prompt=get_system_prompt("query"),
         user_prompt=user_prompt,
-        temperature=0.5
+        cached_prefix=context_block,
+        temperature=0.5,
+        **_stream_kwargs(on_partial),
     )
-    return result, expanded_files
-
-
 
 
 def interactive_query(
@@ -423,11 +731,18 @@ def interactive_query(
             console.print()
             continue
         
-        # Select relevant files
-        selection = select_relevant_files(question, brain, client)
+        # Select relevant files (recently used files load meanwhile)
+        all_files = brain.list_files()
+        prefetch = _prefetch_hot_files(brain)
+        selection = select_relevant_files(question, brain, client, all_files=all_files)
         
         # Generate answer
-        result = answer_from_brain(question, brain, selection.files, client)
+        with _live_answer() as on_partial:
+            result = answer_from_brain(
+                question, brain, selection.files, client,
+                all_files=all_files, prefetched=_collect_prefetch(prefetch),
+                on_partial=on_partial,
+            )
         
         console.print()
         console.print(result.answer)
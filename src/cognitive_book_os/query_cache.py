@@ -0,0 +1,127 @@
+"""Per-brain cache of answered questions for Cognitive Book OS."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import stat
+
+from .brain import CACHE_DIR, Brain
+from .models import Confidence, QueryResult
+
+QUERY_CACHE_FILE = f"{CACHE_DIR}/query_cache.json"
+QUERY_CACHE_MAX_ENTRIES = 256
+
+_TERM_RE = re.compile(r"\w+")
+_CACHEABLE_CONFIDENCE = {Confidence.HIGH, Confidence.MEDIUM}
+
+
+def query_cache_enabled() -> bool:
+    """Whether answered questions are cached per brain (off unless ENABLE_QUERY_CACHE is set)."""
+    return os.getenv("ENABLE_QUERY_CACHE", "0").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _question_key(question: str) -> str:
+    """Normalize case, punctuation and spacing; word order and every word still count."""
+    return " ".join(_TERM_RE.findall(question.lower()))
+
+
+class QueryCache:
+    """
+    Stores answers keyed by question wording, provider and model.
+
+    Entries are only valid for the brain content they were answered from:
+    any added, removed or modified knowledge file (everything outside
+    ``meta/`` and the cache directory) changes the fingerprint and
+    invalidates the whole cache. Questions match only when they are the
+    same after normalizing case, punctuation and whitespace; questions that
+    merely share most of their words can ask different things.
+    """
+
+    def __init__(self, brain: Brain):
+        self.brain = brain
+        self.path = brain.path / QUERY_CACHE_FILE
+
+    def fingerprint(self) -> str:
+        """Summarize knowledge-file state as '<count>:<latest mtime_ns>:<path digest>'.
+
+        The digest covers the sorted relative paths, so renames and moves
+        (which keep mtimes) still change the fingerprint. Files that vanish
+        mid-scan are skipped.
+        """
+        skipped_dirs = (self.brain.path / "meta", self.brain.path / CACHE_DIR)
+        paths = []
+        latest = 0
+        for file_path in self.brain.path.rglob("*"):
+            if any(d in file_path.parents for d in skipped_dirs):
+                continue
+            try:
+                info = file_path.stat()
+            except OSError:
+                continue
+            if not stat.S_ISREG(info.st_mode):
+                continue
+            paths.append(file_path.relative_to(self.brain.path).as_posix())
+            latest = max(latest, info.st_mtime_ns)
+        digest = hashlib.sha1("\n".join(sorted(paths)).encode("utf-8")).hexdigest()[:16]
+        return f"{len(paths)}:{latest}:{digest}"
+
+    def _load(self) -> dict:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {"fingerprint": "", "entries": []}
+        if not isinstance(data, dict) or not isinstance(data.get("entries"), list):
+            return {"fingerprint": "", "entries": []}
+        return data
+
+    def lookup(self, question: str, provider: str, model: str) -> QueryResult | None:
+        """Return a cached answer for this question, if it was answered before."""
+        data = self._load()
+        if not data["entries"] or data.get("fingerprint") != self.fingerprint():
+            return None
+
+        key = _question_key(question)
+        for entry in reversed(data["entries"]):
+            if entry.get("provider") == provider and entry.get("model") == model and entry.get("key") == key:
+                try:
+                    return QueryResult.model_validate(entry["result"])
+                except (KeyError, ValueError):
+                    return None
+        return None
+
+    def store(self, question: str, provider: str, model: str, result: QueryResult) -> None:
+        """Record an answer; low-confidence answers are not cached."""
+        if result.confidence not in _CACHEABLE_CONFIDENCE:
+            return
+
+        fingerprint = self.fingerprint()
+        data = self._load()
+        entries = data["entries"] if data.get("fingerprint") == fingerprint else []
+        key = _question_key(question)
+        entries = [
+            entry
+            for entry in entries
+            if not (
+                entry.get("provider") == provider
+                and entry.get("model") == model
+                and entry.get("key") == key
+            )
+        ]
+        entries.append(
+            {
+                "question": question,
+                "key": key,
+                "provider": provider,
+                "model": model,
+                "result": result.model_dump(mode="json"),
+            }
+        )
+        payload = {"fingerprint": fingerprint, "entries": entries[-QUERY_CACHE_MAX_ENTRIES:]}
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(payload), encoding="utf-8")
+        os.replace(tmp_path, self.path)
@@ -1,23 +1,36 @@
 """FastAPI Backend for Cognitive Book OS."""
 
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from fastapi import FastAPI, HTTPException, BackgroundTasks, Response, Request
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from dotenv import load_dotenv
 import os
 import time
 import json
 import logging
+import heapq
+import secrets
+import itertools
 import sqlite3
-from threading import RLock, Lock
+from collections import Counter, OrderedDict
+from types import MappingProxyType
+from threading import Event, RLock, Lock, Thread
 
-from .brain import Brain
+try:
+    import orjson  # Optional: faster job-store/report serialization
+except ImportError:
+    orjson = None
+
+from .brain import CACHE_DIR, Brain
 from .gardener import run_gardener_for_brain
 from .gardener_scheduler import GardenerScheduler, discover_brain_names, parse_interval_seconds
 from .claim_store import (
     ClaimStore,
+    claim_cursor,
     claims_versioning_enabled,
     query_audit_endpoints_enabled,
     provenance_enforcement_mode,
@@ -27,10 +40,14 @@ from .orchestration import (
     MultiBrainInputError,
     orchestrate_multi_brain_query,
 )
+from .enrichment import EnrichmentManager
+from .graph import build_graph_data
 from .query import select_relevant_files, answer_from_brain, answer_from_brain_with_audit
 from .llm import get_client
 from .models import (
+    ClaimSnapshot,
     ClaimStatus,
+    Confidence,
     MultiBrainQueryRequest,
     MultiBrainQueryResult,
     QueryAuditResult,
@@ -41,17 +58,21 @@ load_dotenv()
 
 app = FastAPI(title="Cognitive Book OS API", version="1.0.0")
 
-def _get_cors_origins() -> list[str]:
+_DEFAULT_CORS_ORIGINS = (
+    "http://localhost:5173",
+    "http://127.0.0.1:5173",
+    "http://localhost:8501",
+    "http://127.0.0.1:8501",
+)
+
+
+@lru_cache(maxsize=1)
+def _get_cors_origins() -> tuple[str, ...]:
     """Read CORS origins from env, with safe local-development defaults."""
     raw = os.getenv("CORS_ALLOW_ORIGINS")
     if not raw:
-        return [
-            "http://localhost:5173",
-            "http://127.0.0.1:5173",
-            "http://localhost:8501",
-            "http://127.0.0.1:8501",
-        ]
-    return [origin.strip() for origin in raw.split(",") if origin.strip()]
+        return _DEFAULT_CORS_ORIGINS
+    return tuple(origin for origin in map(str.strip, raw.split(",")) if origin)
 
 
 # Enable CORS
@@ -67,18 +88,26 @@ BRAINS_DIR = os.getenv("BRAINS_DIR", "brains")
 DEFAULT_QUERY_PROVIDER = os.getenv("DEFAULT_QUERY_PROVIDER", "anthropic")
 REQUIRE_API_KEY = os.getenv("REQUIRE_API_KEY", "")
 RATE_LIMIT_PER_MINUTE = int(os.getenv("RATE_LIMIT_PER_MINUTE", "0"))
+RATE_LIMIT_MAX_CLIENTS = max(int(os.getenv("RATE_LIMIT_MAX_CLIENTS", "10000")), 1)
 MAX_JOB_HISTORY = int(os.getenv("MAX_JOB_HISTORY", "200"))
 JOB_STORE_PATH = Path(os.getenv("JOB_STORE_PATH", "dist/job_store.json"))
 JOB_STORE_BACKEND = os.getenv("JOB_STORE_BACKEND", "json").strip().lower()
 JOB_STORE_SQLITE_PATH = Path(os.getenv("JOB_STORE_SQLITE_PATH", "dist/job_store.db"))
+# 0 persists on every job update; >0 batches updates and flushes after this delay
+JOB_STORE_FLUSH_INTERVAL_MS = max(int(os.getenv("JOB_STORE_FLUSH_INTERVAL_MS", "0")), 0)
 MAX_UPLOAD_MB = int(os.getenv("MAX_UPLOAD_MB", "100"))
 UPLOAD_DIR = Path(os.getenv("UPLOAD_DIR", "dist/uploads"))
+# Uploads are copied (and size-checked) in chunks of this many bytes
+_UPLOAD_CHUNK_BYTES = 1 << 20
 INGEST_TIMEOUT_SEC = int(os.getenv("INGEST_TIMEOUT_SEC", "7200"))
+INGEST_IN_PROCESS = os.getenv("INGEST_IN_PROCESS", "0").strip().lower() in {"1", "true", "yes", "on"}
 ENABLE_METRICS = os.getenv("ENABLE_METRICS", "1").lower() in {"1", "true", "yes", "on"}
 METRICS_API_KEY = os.getenv("METRICS_API_KEY", "")
 METRICS_MAX_PATHS = int(os.getenv("METRICS_MAX_PATHS", "200"))
 REQUEST_LOG_JSON = os.getenv("REQUEST_LOG_JSON", "1").lower() in {"1", "true", "yes", "on"}
 REQUEST_LOG_LEVEL = os.getenv("REQUEST_LOG_LEVEL", "INFO").upper()
+PROBE_PATH_BYPASS = os.getenv("PROBE_PATH_BYPASS", "0").strip().lower() in {"1", "true", "yes", "on"}
+REQUEST_LOG_MAX_PATH_CHARS = max(int(os.getenv("REQUEST_LOG_MAX_PATH_CHARS", "512")), 1)
 ENABLE_CLAIM_VERSIONING = claims_versioning_enabled()
 ENABLE_QUERY_AUDIT_ENDPOINTS = query_audit_endpoints_enabled()
 PROVENANCE_ENFORCEMENT = provenance_enforcement_mode()
@@ -88,7 +117,7 @@ MULTI_BRAIN_MAX_FILES_PER_BRAIN = max(int(os.getenv("MULTI_BRAIN_MAX_FILES_PER_B
 GARDENER_ENABLED = os.getenv("GARDENER_ENABLED", "0").strip().lower() in {"1", "true", "yes", "on"}
 GARDENER_INTERVAL = os.getenv("GARDENER_INTERVAL", "weekly").strip().lower()
 GARDENER_DRY_RUN = os.getenv("GARDENER_DRY_RUN", "1").strip().lower() in {"1", "true", "yes", "on"}
-GARDENER_BRAIN_EXCLUDE = tuple(
+GARDENER_BRAIN_EXCLUDE = frozenset(
     part.strip()
     for part in os.getenv("GARDENER_BRAIN_EXCLUDE", "").split(",")
     if part.strip()
@@ -106,42 +135,103 @@ import uuid
 ingestion_jobs: Dict[str, Dict[str, Any]] = {}
 enrichment_jobs: Dict[str, Dict[str, Any]] = {}
 gardener_runs: Dict[str, Dict[str, Any]] = {}
-rate_limit_store: Dict[str, Dict[str, int | float]] = {}
-_rate_limit_last_pruned_window: int = -1
+# Serialized job payloads by (kind, job_id); refreshed by _upsert_job
+_job_json_cache: Dict[tuple[str, str], str] = {}
+_JOB_STORES_BY_KIND: Dict[str, Dict[str, Dict[str, Any]]] = {
+    "ingestion": ingestion_jobs,
+    "enrichment": enrichment_jobs,
+    "gardener": gardener_runs,
+}
+# (kind, job_id) pairs awaiting a debounced flush; guarded by _job_store_lock
+_job_store_dirty: set[tuple[str, str]] = set()
+_job_store_flush_event = Event()
+_job_store_flusher: Optional[Thread] = None
+# (path, content hash) of the last JSON job-store write
+_job_store_json_last_write: Optional[tuple[Path, int]] = None
+# client host -> (window id, previous window count, current window count),
+# least recently seen first; capped at RATE_LIMIT_MAX_CLIENTS
+rate_limit_store: "OrderedDict[str, tuple[int, int, int]]" = OrderedDict()
+_PROBE_PATHS = frozenset({"/health", "/health/ready", "/metrics"})
+# Probe requests served through the PROBE_PATH_BYPASS fast path
+_probe_hits = 0
+# Jobs whose work is still running; trimmed from history last
+_ACTIVE_JOB_STATUSES = frozenset({"processing", "timed_out"})
 _job_store_lock = RLock()
-_metrics_lock = RLock()
+# Long-lived SQLite job-store connection; guarded by _job_store_lock
+_sqlite_conn: Optional[sqlite3.Connection] = None
+_sqlite_conn_path: Optional[Path] = None
+# Read-only job-store connection for probes; guarded by _sqlite_reader_lock
+_sqlite_reader_lock = Lock()
+_sqlite_reader: Optional[sqlite3.Connection] = None
+_sqlite_reader_path: Optional[Path] = None
+# brain directory -> (listing signature, BrainInfo) for GET /brains
+_brain_info_cache: Dict[str, tuple[tuple, Any]] = {}
+_brain_info_cache_lock = Lock()
+# Held only for a handful of counter updates per request; not re-entered
+_metrics_lock = Lock()
 _gardener_scheduler_lock = RLock()
 _gardener_execution_lock = Lock()
 _gardener_scheduler: Optional[GardenerScheduler] = None
+# Uptime is measured on the monotonic clock; started_at is for display only
+_process_start_monotonic = time.monotonic()
 _operational_metrics: Dict[str, Any] = {
     "started_at": datetime.now().isoformat(),
     "requests_total": 0,
-    "responses_by_status": {},
-    "requests_by_method": {},
-    "requests_by_path": {},
+    "responses_by_status": Counter(),
+    "requests_by_method": Counter(),
+    "requests_by_path": Counter(),
     "auth_failures": 0,
     "rate_limited": 0,
-    "latency_ms": {"count": 0, "sum": 0.0, "max": 0.0},
+    "latency_ns": {"count": 0, "sum": 0, "max": 0},
 }
 logger = logging.getLogger("cognitive_book_os.server")
 logger.setLevel(getattr(logging, REQUEST_LOG_LEVEL, logging.INFO))
 
 
-def _trim_job_history(store: Dict[str, Dict[str, Any]], max_items: int = MAX_JOB_HISTORY) -> None:
-    """Keep only the most recent job entries to bound in-memory growth."""
+def _dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize to JSON text, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=True, indent=2 if indent else None)
+
+
+def _dump_bytes(obj: Any, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes; with orjson there is no intermediate str."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, ensure_ascii=True, indent=2 if indent else None).encode("utf-8")
+
+
+def _loads(raw: str | bytes) -> Any:
+    """Parse JSON text, using orjson when installed (errors are ValueError either way)."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _trim_job_history(store: Dict[str, Dict[str, Any]], max_items: int = MAX_JOB_HISTORY) -> list[str]:
+    """Keep only the most recent job entries to bound in-memory growth. Returns removed ids."""
     if max_items <= 0:
-        return
+        return []
     if len(store) <= max_items:
-        return
+        return []
 
-    # Sort by started_at (ISO strings sort chronologically) and drop oldest.
-    ordered = sorted(
+    # Pick the oldest by started_at (ISO strings sort chronologically) without
+    # sorting the whole store; usually only one entry is over the limit.
+    # Finished jobs go first so a long-running job keeps its record.
+    to_remove = len(store) - max_items
+    oldest = heapq.nsmallest(
+        to_remove,
         store.items(),
-        key=lambda item: item[1].get("started_at", ""),
+        key=lambda item: (
+            item[1].get("status") in _ACTIVE_JOB_STATUSES,
+            item[1].get("started_at", ""),
+        ),
     )
-    to_remove = len(store) - max_items
-    for job_id, _ in ordered[:to_remove]:
+    removed = [job_id for job_id, _ in oldest]
+    for job_id in removed:
         store.pop(job_id, None)
+    return removed
 
 
 def _job_store_backend() -> str:
@@ -149,17 +239,49 @@ def _job_store_backend() -> str:
     return "sqlite" if JOB_STORE_BACKEND == "sqlite" else "json"
 
 
+def _job_json_locked(kind: str, job_id: str, payload: Dict[str, Any]) -> str:
+    """Serialized job payload, reused until the job is next upserted. Caller must hold _job_store_lock."""
+    key = (kind, job_id)
+    cached = _job_json_cache.get(key)
+    if cached is None:
+        cached = _job_json_cache[key] = _dumps(payload)
+    return cached
+
+
 def _save_job_store_json_locked() -> None:
     """Persist job state atomically to JSON."""
     JOB_STORE_PATH.parent.mkdir(parents=True, exist_ok=True)
-    payload = {
-        "ingestion_jobs": ingestion_jobs,
-        "enrichment_jobs": enrichment_jobs,
-        "gardener_runs": gardener_runs,
-    }
+    # Assembled from per-job fragments so unchanged jobs are not re-encoded
+    sections = []
+    for key, kind, store in (
+        ("ingestion_jobs", "ingestion", ingestion_jobs),
+        ("enrichment_jobs", "enrichment", enrichment_jobs),
+        ("gardener_runs", "gardener", gardener_runs),
+    ):
+        entries = ", ".join(
+            f"{_dumps(job_id)}: {_job_json_locked(kind, job_id, payload)}"
+            for job_id, payload in store.items()
+        )
+        sections.append(f"\"{key}\": {{{entries}}}")
+    data = ("{" + ", ".join(sections) + "}").encode("utf-8")
+
+    # Polling and no-op updates often produce identical content; skip those writes
+    global _job_store_json_last_write
+    content_hash = hash(data)
+    if _job_store_json_last_write == (JOB_STORE_PATH, content_hash) and JOB_STORE_PATH.exists():
+        return
+
     temp_path = JOB_STORE_PATH.with_suffix(f"{JOB_STORE_PATH.suffix}.tmp")
-    temp_path.write_text(json.dumps(payload, ensure_ascii=True), encoding="utf-8")
-    temp_path.replace(JOB_STORE_PATH)
+    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(temp_path, JOB_STORE_PATH)
+    _job_store_json_last_write = (JOB_STORE_PATH, content_hash)
 
 
 def _ensure_sqlite_schema(conn: sqlite3.Connection) -> None:
@@ -176,43 +298,189 @@ def _ensure_sqlite_schema(conn: sqlite3.Connection) -> None:
     )
 
 
-def _save_job_store_sqlite_locked() -> None:
-    """Persist full in-memory job state into SQLite."""
+_SQLITE_PRAGMAS = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA busy_timeout=5000;
+PRAGMA temp_store=MEMORY;
+PRAGMA cache_size=-4000;
+"""
+
+
+def _sqlite_connection_locked() -> sqlite3.Connection:
+    """
+    Return the shared job-store connection, opening it on first use.
+
+    Reopened if JOB_STORE_SQLITE_PATH changes. Caller must hold _job_store_lock.
+    """
+    global _sqlite_conn, _sqlite_conn_path
+    if _sqlite_conn is not None and _sqlite_conn_path == JOB_STORE_SQLITE_PATH:
+        return _sqlite_conn
+    _close_sqlite_connection_locked()
+
     JOB_STORE_SQLITE_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with sqlite3.connect(JOB_STORE_SQLITE_PATH) as conn:
+    conn = sqlite3.connect(JOB_STORE_SQLITE_PATH, timeout=5.0, check_same_thread=False)
+    try:
+        conn.executescript(_SQLITE_PRAGMAS)
         _ensure_sqlite_schema(conn)
+        conn.commit()
+    except sqlite3.Error:
+        conn.close()
+        raise
+    _sqlite_conn = conn
+    _sqlite_conn_path = JOB_STORE_SQLITE_PATH
+    return conn
+
+
+def _close_sqlite_connection_locked() -> None:
+    """Close the shared job-store connection, if open. Caller must hold _job_store_lock."""
+    global _sqlite_conn, _sqlite_conn_path
+    if _sqlite_conn is not None:
+        _sqlite_conn.close()
+    _sqlite_conn = None
+    _sqlite_conn_path = None
+
+
+def _sqlite_reader_connection() -> sqlite3.Connection:
+    """
+    Return the read-only job-store connection, opening it on first use.
+
+    Probes use this instead of the writer so they never wait on _job_store_lock
+    once the database exists. Caller must hold _sqlite_reader_lock.
+    """
+    global _sqlite_reader, _sqlite_reader_path
+    if _sqlite_reader is not None and _sqlite_reader_path == JOB_STORE_SQLITE_PATH:
+        return _sqlite_reader
+    _close_sqlite_reader_locked()
+
+    if not JOB_STORE_SQLITE_PATH.exists():
+        # The writer creates the file and schema; read-only mode cannot
+        with _job_store_lock:
+            _sqlite_connection_locked()
+    conn = sqlite3.connect(
+        f"{JOB_STORE_SQLITE_PATH.resolve().as_uri()}?mode=ro",
+        uri=True,
+        timeout=5.0,
+        check_same_thread=False,
+    )
+    _sqlite_reader = conn
+    _sqlite_reader_path = JOB_STORE_SQLITE_PATH
+    return conn
+
+
+def _close_sqlite_reader_locked() -> None:
+    """Close the read-only job-store connection, if open. Caller must hold _sqlite_reader_lock."""
+    global _sqlite_reader, _sqlite_reader_path
+    if _sqlite_reader is not None:
+        _sqlite_reader.close()
+    _sqlite_reader = None
+    _sqlite_reader_path = None
+
+
+def _job_rows_locked(kind: str, store: Dict[str, Dict[str, Any]]) -> Iterator[tuple[str, str, str, str]]:
+    """Yield job_store rows for one job dict. Caller must hold _job_store_lock."""
+    for job_id, payload in store.items():
+        yield kind, job_id, str(payload.get("started_at", "")), _job_json_locked(kind, job_id, payload)
+
+
+def _save_job_store_sqlite_locked() -> None:
+    """Persist full in-memory job state into SQLite."""
+    conn = _sqlite_connection_locked()
+    with conn:
         conn.execute("DELETE FROM job_store")
-        ingestion_rows = [
-            (
-                "ingestion",
-                job_id,
-                str(payload.get("started_at", "")),
-                json.dumps(payload, ensure_ascii=True),
-            )
-            for job_id, payload in ingestion_jobs.items()
-        ]
-        enrichment_rows = [
-            (
-                "enrichment",
-                job_id,
-                str(payload.get("started_at", "")),
-                json.dumps(payload, ensure_ascii=True),
-            )
-            for job_id, payload in enrichment_jobs.items()
-        ]
-        gardener_rows = [
-            (
-                "gardener",
-                job_id,
-                str(payload.get("started_at", "")),
-                json.dumps(payload, ensure_ascii=True),
-            )
-            for job_id, payload in gardener_runs.items()
-        ]
         conn.executemany(
             "INSERT INTO job_store (kind, job_id, started_at, payload) VALUES (?, ?, ?, ?)",
-            ingestion_rows + enrichment_rows + gardener_rows,
+            itertools.chain.from_iterable(
+                _job_rows_locked(kind, store) for kind, store in _JOB_STORES_BY_KIND.items()
+            ),
+        )
+
+
+def _job_store_kind(store: Dict[str, Dict[str, Any]]) -> Optional[str]:
+    """Map an in-memory job dict to its job_store `kind` column value."""
+    if store is ingestion_jobs:
+        return "ingestion"
+    if store is enrichment_jobs:
+        return "enrichment"
+    if store is gardener_runs:
+        return "gardener"
+    return None
+
+
+def _persist_job_rows_sqlite_locked(changed: set[tuple[str, str]]) -> None:
+    """
+    Upsert the given (kind, job_id) rows; ones no longer in memory (trimmed)
+    are deleted. Caller must hold _job_store_lock.
+    """
+    upserts = []
+    deletes = []
+    for kind, job_id in changed:
+        payload = _JOB_STORES_BY_KIND[kind].get(job_id)
+        if payload is None:
+            deletes.append((kind, job_id))
+        else:
+            upserts.append(
+                (kind, job_id, str(payload.get("started_at", "")), _job_json_locked(kind, job_id, payload))
+            )
+    conn = _sqlite_connection_locked()
+    with conn:
+        conn.executemany(
+            """
+            INSERT INTO job_store (kind, job_id, started_at, payload) VALUES (?, ?, ?, ?)
+            ON CONFLICT(kind, job_id) DO UPDATE SET
+                started_at=excluded.started_at,
+                payload=excluded.payload
+            """,
+            upserts,
         )
+        conn.executemany("DELETE FROM job_store WHERE kind = ? AND job_id = ?", deletes)
+
+
+def _flush_job_store_locked(changed: set[tuple[str, str]]) -> None:
+    """Write the given job changes with the configured backend. Caller must hold _job_store_lock."""
+    if _job_store_backend() == "sqlite":
+        _persist_job_rows_sqlite_locked(changed)
+    else:
+        _save_job_store_json_locked()
+
+
+def _run_job_store_flusher() -> None:
+    """Background loop: coalesce job updates for JOB_STORE_FLUSH_INTERVAL_MS, then write once."""
+    while True:
+        _job_store_flush_event.wait()
+        time.sleep(JOB_STORE_FLUSH_INTERVAL_MS / 1000)
+        _job_store_flush_event.clear()
+        try:
+            _flush_pending_job_store()
+        except Exception:
+            # The changes are still buffered; retry after the next interval
+            logger.exception("Job store flush failed")
+            _job_store_flush_event.set()
+
+
+def _flush_pending_job_store() -> None:
+    """Synchronously write any buffered job updates."""
+    with _job_store_lock:
+        if not _job_store_dirty:
+            return
+        changed = set(_job_store_dirty)
+        _job_store_dirty.clear()
+        try:
+            _flush_job_store_locked(changed)
+        except Exception:
+            # Only changed rows are upserted, so dropping these would lose them
+            _job_store_dirty.update(changed)
+            raise
+
+
+def _schedule_job_store_flush_locked(changed: set[tuple[str, str]]) -> None:
+    """Buffer job changes for the flusher thread, starting it on first use. Caller must hold _job_store_lock."""
+    global _job_store_flusher
+    _job_store_dirty.update(changed)
+    if _job_store_flusher is None or not _job_store_flusher.is_alive():
+        _job_store_flusher = Thread(target=_run_job_store_flusher, name="job-store-flusher", daemon=True)
+        _job_store_flusher.start()
+    _job_store_flush_event.set()
 
 
 def _persist_job_store_locked() -> None:
@@ -240,17 +508,15 @@ def _load_job_store() -> None:
             if not JOB_STORE_SQLITE_PATH.exists():
                 return
             try:
-                with sqlite3.connect(JOB_STORE_SQLITE_PATH) as conn:
-                    _ensure_sqlite_schema(conn)
-                    rows = conn.execute(
-                        "SELECT kind, payload FROM job_store ORDER BY started_at ASC"
-                    ).fetchall()
+                rows = _sqlite_connection_locked().execute(
+                    "SELECT kind, payload FROM job_store ORDER BY started_at ASC"
+                ).fetchall()
             except sqlite3.Error:
                 return
 
             for kind, payload_raw in rows:
                 try:
-                    payload = json.loads(payload_raw)
+                    payload = _loads(payload_raw)
                 except ValueError:
                     continue
                 if not isinstance(payload, dict):
@@ -268,7 +534,7 @@ def _load_job_store() -> None:
             if not JOB_STORE_PATH.exists():
                 return
             try:
-                data = json.loads(JOB_STORE_PATH.read_text(encoding="utf-8"))
+                data = _loads(JOB_STORE_PATH.read_bytes())
             except (OSError, ValueError):
                 # Ignore corrupt store and continue with empty in-memory state.
                 return
@@ -282,36 +548,61 @@ def _load_job_store() -> None:
             if isinstance(maybe_gardener, dict):
                 loaded_gardener = maybe_gardener
 
+        _job_json_cache.clear()
         ingestion_jobs.clear()
         ingestion_jobs.update(loaded_ingestion)
         enrichment_jobs.clear()
         enrichment_jobs.update(loaded_enrichment)
         gardener_runs.clear()
         gardener_runs.update(loaded_gardener)
-        _trim_job_history(ingestion_jobs)
-        _trim_job_history(enrichment_jobs)
-        _trim_job_history(gardener_runs, max_items=MAX_GARDENER_HISTORY)
+        trimmed = (
+            _trim_job_history(ingestion_jobs)
+            + _trim_job_history(enrichment_jobs)
+            + _trim_job_history(gardener_runs, max_items=MAX_GARDENER_HISTORY)
+        )
+        if trimmed and _job_store_backend() == "sqlite":
+            # Compact rows dropped by a lowered history limit
+            try:
+                _save_job_store_sqlite_locked()
+            except sqlite3.Error:
+                pass
 
 
 def _upsert_job(store: Dict[str, Dict[str, Any]], job_id: str, updates: Dict[str, Any]) -> None:
-    """Thread-safe update helper that also persists job state."""
+    """Thread-safe update helper that also persists job state.
+
+    Job payloads are copy-on-write: each update publishes a fresh dict, so
+    status endpoints can read the stores without taking ``_job_store_lock``.
+    """
     with _job_store_lock:
-        current = store.get(job_id, {})
-        current.update(updates)
+        current = {**store.get(job_id, {}), **updates}
         store[job_id] = current
         max_items = MAX_GARDENER_HISTORY if store is gardener_runs else MAX_JOB_HISTORY
-        _trim_job_history(store, max_items=max_items)
-        _persist_job_store_locked()
+        removed = _trim_job_history(store, max_items=max_items)
+        kind = _job_store_kind(store)
+        if kind is None:
+            _persist_job_store_locked()
+            return
+
+        changed = {(kind, job_id), *((kind, removed_id) for removed_id in removed)}
+        for key in changed:
+            _job_json_cache.pop(key, None)
+        if JOB_STORE_FLUSH_INTERVAL_MS > 0:
+            _schedule_job_store_flush_locked(changed)
+        else:
+            _flush_job_store_locked(changed)
+
+
+_PROVIDER_API_KEY_ENVS = MappingProxyType({
+    "openai": "OPENAI_API_KEY",
+    "anthropic": "ANTHROPIC_API_KEY",
+    "openrouter": "OPENROUTER_API_KEY",
+    "minimax": "MINIMAX_API_KEY",
+})
 
 
 def _provider_api_key_env(provider: str) -> Optional[str]:
-    mapping = {
-        "openai": "OPENAI_API_KEY",
-        "anthropic": "ANTHROPIC_API_KEY",
-        "openrouter": "OPENROUTER_API_KEY",
-        "minimax": "MINIMAX_API_KEY",
-    }
-    return mapping.get((provider or "").strip().lower())
+    return _PROVIDER_API_KEY_ENVS.get((provider or "").strip().lower())
 
 
 def _provider_is_configured(provider: str) -> tuple[bool, str]:
@@ -410,8 +701,7 @@ def _list_target_brains(explicit_brains: Optional[list[str]] = None) -> list[str
         brain_names = [name.strip() for name in explicit_brains if name.strip()]
     else:
         brain_names = discover_brain_names(BRAINS_DIR)
-        excluded = set(GARDENER_BRAIN_EXCLUDE)
-        brain_names = [name for name in brain_names if name not in excluded]
+        brain_names = [name for name in brain_names if name not in GARDENER_BRAIN_EXCLUDE]
     return sorted(set(brain_names))
 
 
@@ -421,7 +711,7 @@ def _create_gardener_run_record(
     dry_run: bool,
     trigger: str,
 ) -> str:
-    run_id = f"gardener_{datetime.now().strftime('%Y%m%d%H%M%S')}_{uuid.uuid4().hex[:8]}"
+    run_id = f"gardener_{time.strftime('%Y%m%d%H%M%S')}_{secrets.token_hex(4)}"
     _upsert_job(
         gardener_runs,
         run_id,
@@ -505,7 +795,7 @@ def _execute_gardener_run(run_id: str) -> None:
 
                 json_rel = f"meta/reports/gardener_{run_id}.json"
                 md_rel = f"meta/reports/gardener_{run_id}.md"
-                brain.write_file(json_rel, json.dumps(report, ensure_ascii=True, indent=2))
+                brain.write_file(json_rel, _dump_bytes(report, indent=True))
                 brain.write_file(md_rel, _render_gardener_report_markdown(report))
                 _prune_brain_reports(brain, keep_last=GARDENER_REPORT_RETENTION)
 
@@ -611,7 +901,7 @@ def _stop_gardener_scheduler() -> None:
         scheduler.stop()
 
 
-def _record_request_metrics(request: Request, status_code: int, duration_ms: float) -> None:
+def _record_request_metrics(request: Request, status_code: int, duration_ns: int) -> None:
     """Track bounded in-memory operational metrics."""
     if not ENABLE_METRICS:
         return
@@ -619,49 +909,57 @@ def _record_request_metrics(request: Request, status_code: int, duration_ms: flo
     method = request.method
     path = request.url.path
 
-    with _metrics_lock:
-        _operational_metrics["requests_total"] += 1
-
-        by_status = _operational_metrics["responses_by_status"]
-        status_key = str(status_code)
-        by_status[status_key] = int(by_status.get(status_key, 0)) + 1
+    status_key = str(status_code)
+    max_paths = max(METRICS_MAX_PATHS, 1)
 
-        by_method = _operational_metrics["requests_by_method"]
-        by_method[method] = int(by_method.get(method, 0)) + 1
+    with _metrics_lock:
+        metrics = _operational_metrics
+        metrics["requests_total"] += 1
+        metrics["responses_by_status"][status_key] += 1
+        metrics["requests_by_method"][method] += 1
 
-        by_path = _operational_metrics["requests_by_path"]
-        if path not in by_path and len(by_path) >= max(METRICS_MAX_PATHS, 1):
+        by_path = metrics["requests_by_path"]
+        if path not in by_path and len(by_path) >= max_paths:
             path = "__other__"
-        by_path[path] = int(by_path.get(path, 0)) + 1
+        by_path[path] += 1
 
-        lat = _operational_metrics["latency_ms"]
-        lat["count"] = int(lat.get("count", 0)) + 1
-        lat["sum"] = float(lat.get("sum", 0.0)) + duration_ms
-        lat["max"] = max(float(lat.get("max", 0.0)), duration_ms)
+        lat = metrics["latency_ns"]
+        lat["count"] += 1
+        lat["sum"] += duration_ns
+        if duration_ns > lat["max"]:
+            lat["max"] = duration_ns
 
 
-def _log_request(request: Request, status_code: int, duration_ms: float, request_id: str) -> None:
+def _log_request(request: Request, status_code: int, duration_ns: int, request_id: str) -> None:
     """Emit structured request logs for production debugging and tracing."""
+    # Skip building the record entirely when INFO is filtered out
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
+    path = request.url.path
+    if len(path) > REQUEST_LOG_MAX_PATH_CHARS:
+        path = path[:REQUEST_LOG_MAX_PATH_CHARS] + "..."
+    if not REQUEST_LOG_JSON:
+        logger.info(
+            "%s %s %s %.3fms id=%s",
+            request.method,
+            path,
+            status_code,
+            duration_ns / 1_000_000,
+            request_id,
+        )
+        return
+
     payload = {
         "event": "http_request",
         "request_id": request_id,
         "method": request.method,
-        "path": request.url.path,
+        "path": path,
         "status_code": status_code,
-        "duration_ms": round(duration_ms, 3),
+        "duration_ms": round(duration_ns / 1_000_000, 3),
         "client_ip": request.client.host if request.client else "unknown",
     }
-    if REQUEST_LOG_JSON:
-        logger.info(json.dumps(payload, ensure_ascii=True, sort_keys=True))
-    else:
-        logger.info(
-            "%s %s %s %.3fms id=%s",
-            payload["method"],
-            payload["path"],
-            payload["status_code"],
-            payload["duration_ms"],
-            payload["request_id"],
-        )
+    logger.info(json.dumps(payload, ensure_ascii=True, sort_keys=True))
 
 
 _load_job_store()
@@ -679,10 +977,39 @@ def shutdown_gardener_scheduler() -> None:
     _stop_gardener_scheduler()
 
 
+@app.on_event("shutdown")
+def close_job_store() -> None:
+    """Flush buffered job updates and close the shared SQLite job-store connections."""
+    with _sqlite_reader_lock:
+        _close_sqlite_reader_locked()
+    with _job_store_lock:
+        _flush_pending_job_store()
+        _close_sqlite_connection_locked()
+
+
+def _rate_limit_allows(client_host: str, now: float, current_window: int) -> bool:
+    """
+    Sliding-window check: the previous minute's count is weighted by how much
+    of it still overlaps the last 60 seconds. Records the request if allowed.
+    """
+    window, prev_count, cur_count = rate_limit_store.get(client_host, (current_window, 0, 0))
+    if window != current_window:
+        prev_count = cur_count if window == current_window - 1 else 0
+        cur_count = 0
+    elapsed = (now % 60) / 60
+    allowed = prev_count * (1 - elapsed) + cur_count < RATE_LIMIT_PER_MINUTE
+    rate_limit_store[client_host] = (current_window, prev_count, cur_count + allowed)
+    rate_limit_store.move_to_end(client_host)
+    # Evict the least recently seen hosts so memory stays bounded under IP churn
+    while len(rate_limit_store) > RATE_LIMIT_MAX_CLIENTS:
+        rate_limit_store.popitem(last=False)
+    return allowed
+
+
 @app.middleware("http")
 async def security_middleware(request: Request, call_next):
     """Optional API key auth and request rate limiting for production."""
-    started = time.perf_counter()
+    started_ns = time.monotonic_ns()
     request_id = request.headers.get("x-request-id", uuid.uuid4().hex)
 
     # Optional API-key authentication
@@ -690,54 +1017,44 @@ async def security_middleware(request: Request, call_next):
         api_key = request.headers.get("x-api-key", "")
         if api_key != REQUIRE_API_KEY:
             with _metrics_lock:
-                _operational_metrics["auth_failures"] = int(_operational_metrics.get("auth_failures", 0)) + 1
-            duration_ms = (time.perf_counter() - started) * 1000.0
-            _record_request_metrics(request, 401, duration_ms)
-            _log_request(request, 401, duration_ms, request_id)
+                _operational_metrics["auth_failures"] += 1
+            duration_ns = time.monotonic_ns() - started_ns
+            _record_request_metrics(request, 401, duration_ns)
+            _log_request(request, 401, duration_ns, request_id)
             return Response("Unauthorized", status_code=401, headers={"X-Request-ID": request_id})
 
+    # Probes skip rate limiting, metrics and request logs (auth still applies)
+    if PROBE_PATH_BYPASS and request.url.path in _PROBE_PATHS:
+        global _probe_hits
+        _probe_hits += 1
+        response = await call_next(request)
+        response.headers["X-Request-ID"] = request_id
+        return response
+
     # Optional simple in-memory rate limiting (per client IP, per minute)
     if RATE_LIMIT_PER_MINUTE > 0:
-        global _rate_limit_last_pruned_window
         client_host = request.client.host if request.client else "unknown"
-        now = int(time.time())
-        current_window = now // 60
-
-        # Prune stale buckets once per window to avoid unbounded growth.
-        if _rate_limit_last_pruned_window != current_window:
-            stale_hosts = [
-                host for host, bucket in rate_limit_store.items()
-                if int(bucket.get("window", -1)) < current_window
-            ]
-            for host in stale_hosts:
-                rate_limit_store.pop(host, None)
-            _rate_limit_last_pruned_window = current_window
-
-        bucket = rate_limit_store.get(client_host)
-
-        if not bucket or int(bucket["window"]) != current_window:
-            rate_limit_store[client_host] = {"window": current_window, "count": 1}
-        else:
-            if int(bucket["count"]) >= RATE_LIMIT_PER_MINUTE:
-                with _metrics_lock:
-                    _operational_metrics["rate_limited"] = int(_operational_metrics.get("rate_limited", 0)) + 1
-                duration_ms = (time.perf_counter() - started) * 1000.0
-                _record_request_metrics(request, 429, duration_ms)
-                _log_request(request, 429, duration_ms, request_id)
-                return Response("Too Many Requests", status_code=429, headers={"X-Request-ID": request_id})
-            bucket["count"] = int(bucket["count"]) + 1
+        now = time.time()
+        current_window = int(now // 60)
+        if not _rate_limit_allows(client_host, now, current_window):
+            with _metrics_lock:
+                _operational_metrics["rate_limited"] += 1
+            duration_ns = time.monotonic_ns() - started_ns
+            _record_request_metrics(request, 429, duration_ns)
+            _log_request(request, 429, duration_ns, request_id)
+            return Response("Too Many Requests", status_code=429, headers={"X-Request-ID": request_id})
 
     try:
         response = await call_next(request)
     except Exception:
-        duration_ms = (time.perf_counter() - started) * 1000.0
-        _record_request_metrics(request, 500, duration_ms)
-        _log_request(request, 500, duration_ms, request_id)
+        duration_ns = time.monotonic_ns() - started_ns
+        _record_request_metrics(request, 500, duration_ns)
+        _log_request(request, 500, duration_ns, request_id)
         raise
 
-    duration_ms = (time.perf_counter() - started) * 1000.0
-    _record_request_metrics(request, response.status_code, duration_ms)
-    _log_request(request, response.status_code, duration_ms, request_id)
+    duration_ns = time.monotonic_ns() - started_ns
+    _record_request_metrics(request, response.status_code, duration_ns)
+    _log_request(request, response.status_code, duration_ns, request_id)
     response.headers["X-Request-ID"] = request_id
     return response
 
@@ -818,9 +1135,8 @@ def readiness_check(response: Response):
     backend = _job_store_backend()
     if backend == "sqlite":
         try:
-            JOB_STORE_SQLITE_PATH.parent.mkdir(parents=True, exist_ok=True)
-            with sqlite3.connect(JOB_STORE_SQLITE_PATH) as conn:
-                _ensure_sqlite_schema(conn)
+            with _sqlite_reader_lock:
+                _sqlite_reader_connection().execute("SELECT 1").fetchone()
             checks["job_store"] = {"ok": True, "backend": "sqlite", "path": str(JOB_STORE_SQLITE_PATH)}
         except sqlite3.Error as e:
             ready = False
@@ -852,24 +1168,23 @@ def get_metrics(request: Request):
 
     with _metrics_lock:
         started_at = _operational_metrics.get("started_at")
-        latency = dict(_operational_metrics.get("latency_ms", {}))
-        count = int(latency.get("count", 0))
-        avg_ms = float(latency.get("sum", 0.0)) / count if count else 0.0
+        latency = dict(_operational_metrics.get("latency_ns", {}))
+        count = latency.get("count", 0)
+        avg_ms = latency.get("sum", 0) / count / 1_000_000 if count else 0.0
         snapshot = {
             "started_at": started_at,
-            "uptime_seconds": int(
-                max(0.0, datetime.now().timestamp() - datetime.fromisoformat(started_at).timestamp())
-            ) if isinstance(started_at, str) else 0,
+            "uptime_seconds": int(time.monotonic() - _process_start_monotonic),
             "requests_total": int(_operational_metrics.get("requests_total", 0)),
             "responses_by_status": dict(_operational_metrics.get("responses_by_status", {})),
             "requests_by_method": dict(_operational_metrics.get("requests_by_method", {})),
             "requests_by_path": dict(_operational_metrics.get("requests_by_path", {})),
             "auth_failures": int(_operational_metrics.get("auth_failures", 0)),
             "rate_limited": int(_operational_metrics.get("rate_limited", 0)),
+            "probe_requests": _probe_hits,
             "latency_ms": {
                 "count": count,
                 "avg": round(avg_ms, 3),
-                "max": round(float(latency.get("max", 0.0)), 3),
+                "max": round(latency.get("max", 0) / 1_000_000, 3),
             },
         }
     return snapshot
@@ -900,17 +1215,19 @@ def gardener_status():
                 "interval_seconds": snapshot.interval_seconds,
             }
 
-    with _job_store_lock:
-        active_runs = [item for item in gardener_runs.values() if item.get("status") == "processing"]
-    active_runs = sorted(active_runs, key=lambda item: item.get("started_at", ""), reverse=True)
-    active_run_id = active_runs[0].get("run_id") if active_runs else None
+    latest_active = max(
+        (item for item in list(gardener_runs.values()) if item.get("status") == "processing"),
+        key=lambda item: item.get("started_at", ""),
+        default=None,
+    )
+    active_run_id = latest_active.get("run_id") if latest_active else None
 
     return {
         "enabled": GARDENER_ENABLED,
         "defaults": {
             "interval": GARDENER_INTERVAL,
             "dry_run": GARDENER_DRY_RUN,
-            "exclude_brains": list(GARDENER_BRAIN_EXCLUDE),
+            "exclude_brains": sorted(GARDENER_BRAIN_EXCLUDE),
             "provider": GARDENER_PROVIDER,
             "model": GARDENER_MODEL,
             "report_retention": GARDENER_REPORT_RETENTION,
@@ -953,31 +1270,74 @@ def trigger_gardener_run(
 def gardener_history(limit: int = 20):
     """Return recent gardener run records."""
     safe_limit = max(1, min(limit, 200))
-    with _job_store_lock:
-        ordered = sorted(
-            gardener_runs.values(),
-            key=lambda item: item.get("started_at", ""),
-            reverse=True,
-        )
-    return {"runs": ordered[:safe_limit]}
+    recent = heapq.nlargest(
+        safe_limit,
+        list(gardener_runs.values()),
+        key=lambda item: item.get("started_at", ""),
+    )
+    return {"runs": recent}
+
+
+def _brain_listing_signature(brain_dir: Path) -> tuple:
+    """Cheap change stamp for a brain: mtimes of every directory it lists, plus the objective.
+
+    Adding or removing a file bumps its parent directory's mtime, and
+    rewriting the objective bumps ``_objective.md``. Only directories are
+    stamped, so the walk never stats individual notes.
+    """
+    stamps = [("", brain_dir.stat().st_mtime_ns)]
+    pending = [brain_dir]
+    while pending:
+        current = pending.pop()
+        with os.scandir(current) as entries:
+            for entry in entries:
+                if current == brain_dir and entry.name == CACHE_DIR:
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    stamps.append((os.path.relpath(entry.path, brain_dir), entry.stat().st_mtime_ns))
+                    pending.append(Path(entry.path))
+                elif current == brain_dir and entry.name == "_objective.md":
+                    stamps.append((entry.name, entry.stat().st_mtime_ns))
+    return tuple(sorted(stamps))
 
 
 @app.get("/brains", response_model=List[BrainInfo])
 def list_brains():
     """List all available brains."""
     brains = []
-    base_path = Path(BRAINS_DIR)
-    if base_path.exists():
-        for d in base_path.iterdir():
-            if d.is_dir() and (d / "_index.md").exists():
-                brain = Brain(d.name, base_path=BRAINS_DIR)
-                # Count files roughly
-                count = len(brain.list_files())
-                brains.append(BrainInfo(
-                    name=d.name,
-                    objective=brain.get_objective(),
-                    file_count=count
-                ))
+    seen_keys = set()
+    try:
+        entries = os.scandir(BRAINS_DIR)
+    except FileNotFoundError:
+        return brains
+    with entries:
+        for entry in entries:
+            # DirEntry.is_dir() reuses the type from readdir; only _index.md needs a stat
+            if not entry.is_dir() or not os.path.isfile(os.path.join(entry.path, "_index.md")):
+                continue
+            d = Path(entry.path)
+            key = os.path.abspath(entry.path)
+            seen_keys.add(key)
+            signature = _brain_listing_signature(d)
+            with _brain_info_cache_lock:
+                cached = _brain_info_cache.get(key)
+            if cached is not None and cached[0] == signature:
+                brains.append(cached[1])
+                continue
+            brain = Brain(entry.name, base_path=BRAINS_DIR)
+            info = BrainInfo(
+                name=entry.name,
+                objective=brain.get_objective(),
+                file_count=len(brain.list_files()),
+            )
+            with _brain_info_cache_lock:
+                _brain_info_cache[key] = (signature, info)
+            brains.append(info)
+    # Drop entries for brains that were deleted or renamed since the last scan
+    base = os.path.abspath(BRAINS_DIR)
+    with _brain_info_cache_lock:
+        for key in [k for k in _brain_info_cache if os.path.dirname(k) == base and k not in seen_keys]:
+            del _brain_info_cache[key]
     return brains
 
 @app.get("/brains/{name}/structure")
@@ -999,6 +1359,14 @@ def get_file_content(name: str, path: str):
     return {"path": path, "content": content}
 
 
+class ClaimListResponse(BaseModel):
+    # Built on first use, like the deferred models it embeds
+    model_config = ConfigDict(defer_build=True)
+
+    claims: List[ClaimSnapshot]
+    next_cursor: Optional[str] = None
+
+
 @app.get("/brains/{name}/claims")
 def list_claims(
     name: str,
@@ -1008,8 +1376,13 @@ def list_claims(
     q: Optional[str] = None,
     limit: int = 100,
     offset: int = 0,
+    after: Optional[str] = None,
 ):
-    """List materialized claims for a brain."""
+    """List materialized claims for a brain.
+
+    Pass the previous page's ``next_cursor`` as ``after`` to page forward;
+    ``offset`` is kept for existing clients.
+    """
     _require_claim_features()
     brain = get_brain_or_404(name)
     store = ClaimStore(brain)
@@ -1021,15 +1394,22 @@ def list_claims(
         except ValueError:
             raise HTTPException(status_code=400, detail="Invalid claim status")
 
-    claims = store.list_claims(
-        file_path=file,
-        status=parsed_status,
-        tag=tag,
-        q=q,
-        limit=limit,
-        offset=offset,
-    )
-    return {"claims": [claim.model_dump() for claim in claims]}
+    try:
+        claims = store.list_claims(
+            file_path=file,
+            status=parsed_status,
+            tag=tag,
+            q=q,
+            limit=limit,
+            offset=offset,
+            after=after,
+        )
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid claims cursor")
+    next_cursor = claim_cursor(claims[-1]) if claims and len(claims) == limit else None
+    # Encode straight to JSON bytes in pydantic-core, skipping per-claim dicts
+    page = ClaimListResponse.model_construct(claims=claims, next_cursor=next_cursor)
+    return Response(content=page.model_dump_json(), media_type="application/json")
 
 
 @app.get("/brains/{name}/claims/{claim_id}")
@@ -1062,8 +1442,6 @@ def _run_auto_enrichment_task(
     model: Optional[str],
 ) -> None:
     """Run enrichment in a background task and track job status."""
-    from .enrichment import EnrichmentManager
-
     try:
         manager = EnrichmentManager(brain_name, BRAINS_DIR)
         manager.enrich(question, provider, model)
@@ -1104,9 +1482,6 @@ def query_brain_endpoint(
         result = answer_from_brain(request.question, brain, selection.files, client)
         
     # Check for Auto-Enrichment (Active Learning)
-    from .enrichment import EnrichmentManager
-    from .models import Confidence
-    
     current_confidence = result.confidence if result else Confidence.NONE
     
     # If auto_enrich is requested AND confidence is low/none
@@ -1144,12 +1519,15 @@ def query_brain_endpoint(
                 response.headers["X-Enrichment-Job-ID"] = job_id
             else:
                 # Synchronous fallback path
-                manager.enrich(request.question, request.provider, request.model)
+                new_files = manager.enrich(request.question, request.provider, request.model) or []
                 
-                # Re-select files with new knowledge
-                selection = select_relevant_files(request.question, brain, client)
-                if selection.files:
-                    result = answer_from_brain(request.question, brain, selection.files, client)
+                # The earlier selection still holds; add what enrichment wrote and
+                # only re-select when enrichment reports no files
+                retry_files = list(dict.fromkeys(selection.files + new_files)) if new_files else []
+                if not retry_files:
+                    retry_files = select_relevant_files(request.question, brain, client).files
+                if retry_files:
+                    result = answer_from_brain(request.question, brain, retry_files, client)
 
     if not result:
          return QueryResult(
@@ -1256,7 +1634,6 @@ def get_brain_graph(name: str):
     # Ensure brain exists
     get_brain_or_404(name)
     
-    from .graph import build_graph_data
     return build_graph_data(name, BRAINS_DIR)
 
 @app.get("/viz/{name}")
@@ -1264,6 +1641,49 @@ def get_visualization(name: str):
     """Legacy visualization endpoint."""
     return {"message": "Use /brains/{name}/graph for data or CLI 'viz' command."}
 
+# Explorer titles and summaries sit at the top of a file; read this much first
+_EXPLORER_HEAD_CHARS = 2048
+
+
+def _explorer_title_summary(content: str) -> tuple[Optional[str], Optional[str]]:
+    """Return the first H1 title and first body line of a brain file, if any."""
+    title = None
+    summary = None
+    for line in content.split('\n'):
+        if title is None and line.startswith('# '):
+            title = line[2:].strip()
+        elif summary is None and not line.startswith('#') and line.strip() and not line.startswith('---'):
+            summary = line.strip()[:150] + "..."
+        if title is not None and summary is not None:
+            break
+    return title, summary
+
+
+def _explorer_entry(path: Path, relative_path: str, tag: str) -> Optional[Dict[str, Any]]:
+    """Build the explorer list item for one brain file, reading only its head when possible."""
+    try:
+        with open(path, "r", encoding="utf-8") as handle:
+            content = handle.read(_EXPLORER_HEAD_CHARS)
+            if not content:
+                return None
+            if len(content) < _EXPLORER_HEAD_CHARS:
+                title, summary = _explorer_title_summary(content)
+            else:
+                # Ignore the possibly truncated last line; fall back to the whole file
+                title, summary = _explorer_title_summary(content.rpartition('\n')[0])
+                if title is None or summary is None:
+                    title, summary = _explorer_title_summary(content + handle.read())
+    except FileNotFoundError:
+        return None
+
+    return {
+        "id": relative_path,
+        "name": title if title is not None else relative_path.split('/')[-1].replace('.md', '').replace('_', ' ').title(),
+        "summary": summary if summary is not None else "No summary available.",
+        "tags": [tag],  # Placeholder tags
+    }
+
+
 @app.get("/brains/{name}/content")
 def get_brain_content(name: str):
     """Get structured content for the brain explorer (characters, themes, etc)."""
@@ -1275,44 +1695,22 @@ def get_brain_content(name: str):
         "themes": [],
         "facts": []
     }
+    tags = {category: category.capitalize() for category in structure}
     
-    # Helper to parse frontmatter-like content simply for the list view
-    # In a real app, we might use python-frontmatter, but let's stick to standard lib if possible
-    # or just simple line parsing for the summary/tags.
-    
-    for category in structure.keys():
-        files = brain.list_files(category)
-        for f in files:
-            # f is like "characters/tommy_nolan.md"
-            full_content = brain.read_file(f)
-            if not full_content:
-                continue
-                
-            # Extract simple metadata
-            lines = full_content.split('\n')
-            title = f.split('/')[-1].replace('.md', '').replace('_', ' ').title()
-            summary = "No summary available."
-            tags = []
-            
-            # Very basic parsing for demo purposes
-            # Assume first H1 is title
-            for line in lines:
-                if line.startswith('# '):
-                    title = line[2:].strip()
-                    break
-            
-            # Assume first non-header text is summary
-            for line in lines:
-                if not line.startswith('#') and line.strip() and not line.startswith('---'):
-                    summary = line.strip()[:150] + "..."
-                    break
-                    
-            structure[category].append({
-                "id": f,
-                "name": title,
-                "summary": summary,
-                "tags": [category.capitalize()] # Placeholder tags
-            })
+    # One walk of the brain, partitioned by top-level category
+    # f is like "characters/tommy_nolan.md"
+    files = [f for f in brain.list_files() if f.partition('/')[0] in structure]
+    if not files:
+        return structure
+
+    def _entry(f: str) -> Optional[Dict[str, Any]]:
+        return _explorer_entry(brain.path / f, f, tags[f.partition('/')[0]])
+
+    # Overlap the per-file reads; results come back in listing order
+    with ThreadPoolExecutor(max_workers=min(8, len(files))) as executor:
+        for f, entry in zip(files, executor.map(_entry, files)):
+            if entry is not None:
+                structure[f.partition('/')[0]].append(entry)
             
     return structure
 
@@ -1324,7 +1722,59 @@ def get_brain_log(name: str):
 
 # --- Ingestion Support ---
 from fastapi import File, UploadFile, Form
-import shutil
+
+def _start_ingestion_in_process(pdf_path: Path, brain_name: str, objective: str, strategy: str) -> Future:
+    """Start ingestion on a worker thread of this process.
+
+    The returned future can be waited on with a timeout, but the worker
+    thread cannot be killed and keeps running until the pipeline returns.
+    """
+    from .cli import auto_detect_provider
+    from .ingest import process_document
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    future = executor.submit(
+        process_document,
+        document_path=pdf_path,
+        brain_name=brain_name,
+        objective=objective,
+        provider=auto_detect_provider(),
+        brains_dir=BRAINS_DIR,
+        strategy_name=strategy,
+    )
+    executor.shutdown(wait=False)
+    return future
+
+
+def _finish_timed_out_ingestion(future: Future, pdf_path: Path, job_id: str) -> None:
+    """Record the real outcome of an in-process ingestion that outlived its timeout."""
+    error = future.exception()
+    if error is None:
+        _upsert_job(
+            ingestion_jobs,
+            job_id,
+            {
+                "status": "completed",
+                "error": None,
+                "completed_at": datetime.now().isoformat(),
+                "source_pdf_path": str(pdf_path),
+            },
+        )
+        return
+    _upsert_job(
+        ingestion_jobs,
+        job_id,
+        {
+            "status": "failed",
+            "error": str(error),
+            "completed_at": datetime.now().isoformat(),
+        },
+    )
+    try:
+        pdf_path.unlink(missing_ok=True)
+    except OSError:
+        pass
+
 
 @app.post("/ingest")
 async def ingest_brain(
@@ -1342,17 +1792,6 @@ async def ingest_brain(
     if not safe_filename.lower().endswith(".pdf"):
         raise HTTPException(status_code=400, detail="Only PDF uploads are supported.")
 
-    file.file.seek(0, os.SEEK_END)
-    file_size = file.file.tell()
-    file.file.seek(0)
-    if file_size <= 0:
-        raise HTTPException(status_code=400, detail="Uploaded file is empty.")
-    if MAX_UPLOAD_MB > 0 and file_size > (MAX_UPLOAD_MB * 1024 * 1024):
-        raise HTTPException(
-            status_code=413,
-            detail=f"Uploaded file exceeds MAX_UPLOAD_MB={MAX_UPLOAD_MB}.",
-        )
-
     # If strategy is triage, objective is required
     final_objective = objective
     if strategy == "triage" and not final_objective:
@@ -1365,8 +1804,24 @@ async def ingest_brain(
     UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
     
     file_path = UPLOAD_DIR / f"{uuid.uuid4().hex}_{safe_filename}"
+    # Validate the size while copying so the upload is only traversed once
+    max_bytes = MAX_UPLOAD_MB * 1024 * 1024 if MAX_UPLOAD_MB > 0 else 0
+    file_size = 0
     with open(file_path, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
+        while chunk := file.file.read(_UPLOAD_CHUNK_BYTES):
+            file_size += len(chunk)
+            if max_bytes and file_size > max_bytes:
+                break
+            buffer.write(chunk)
+    if file_size <= 0:
+        file_path.unlink(missing_ok=True)
+        raise HTTPException(status_code=400, detail="Uploaded file is empty.")
+    if max_bytes and file_size > max_bytes:
+        file_path.unlink(missing_ok=True)
+        raise HTTPException(
+            status_code=413,
+            detail=f"Uploaded file exceeds MAX_UPLOAD_MB={MAX_UPLOAD_MB}.",
+        )
     
     job_id = f"ingest_{brain_name}_{datetime.now().strftime('%H%M%S')}"
     
@@ -1401,13 +1856,36 @@ async def ingest_brain(
         
         print(f"Starting ingestion for {b_name}...")
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=max(INGEST_TIMEOUT_SEC, 1),
-            )
-            if result.returncode == 0:
+            if INGEST_IN_PROCESS:
+                future = _start_ingestion_in_process(pdf_path, b_name, obj, strat)
+                try:
+                    future.result(timeout=max(INGEST_TIMEOUT_SEC, 1))
+                except FutureTimeoutError:
+                    # The worker can't be stopped: keep its source PDF and let
+                    # it record the final status when it actually finishes
+                    keep_source_pdf = True
+                    _upsert_job(
+                        ingestion_jobs,
+                        jid,
+                        {
+                            "status": "timed_out",
+                            "error": f"Ingestion exceeded {max(INGEST_TIMEOUT_SEC, 1)} seconds and is still running.",
+                        },
+                    )
+                    future.add_done_callback(
+                        lambda done: _finish_timed_out_ingestion(done, pdf_path, jid)
+                    )
+                    return
+                failure = None
+            else:
+                result = subprocess.run(
+                    cmd,
+                    capture_output=True,
+                    text=True,
+                    timeout=max(INGEST_TIMEOUT_SEC, 1),
+                )
+                failure = result.stderr if result.returncode != 0 else None
+            if failure is None:
                 print(f"Ingestion for {b_name} completed successfully.")
                 keep_source_pdf = True
                 _upsert_job(
@@ -1420,13 +1898,13 @@ async def ingest_brain(
                     },
                 )
             else:
-                print(f"Ingestion for {b_name} failed:\n{result.stderr}")
+                print(f"Ingestion for {b_name} failed:\n{failure}")
                 _upsert_job(
                     ingestion_jobs,
                     jid,
                     {
                         "status": "failed",
-                        "error": result.stderr[:500],
+                        "error": failure[:500],
                         "completed_at": datetime.now().isoformat(),
                     },
                 )
@@ -1470,32 +1948,30 @@ async def ingest_brain(
 @app.get("/jobs")
 def get_ingestion_jobs():
     """Get status of all ingestion jobs."""
-    with _job_store_lock:
-        return list(ingestion_jobs.values())
+    return list(ingestion_jobs.values())
 
 @app.get("/jobs/{job_id}")
 def get_job_status(job_id: str):
     """Get status of a specific ingestion job."""
-    with _job_store_lock:
-        if job_id not in ingestion_jobs:
-            raise HTTPException(status_code=404, detail="Job not found")
-        return ingestion_jobs[job_id]
+    job = ingestion_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
 
 
 @app.get("/enrichment-jobs")
 def get_enrichment_jobs():
     """Get status of all auto-enrichment jobs."""
-    with _job_store_lock:
-        return list(enrichment_jobs.values())
+    return list(enrichment_jobs.values())
 
 
 @app.get("/enrichment-jobs/{job_id}")
 def get_enrichment_job_status(job_id: str):
     """Get status of a specific auto-enrichment job."""
-    with _job_store_lock:
-        if job_id not in enrichment_jobs:
-            raise HTTPException(status_code=404, detail="Enrichment job not found")
-        return enrichment_jobs[job_id]
+    job = enrichment_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Enrichment job not found")
+    return job
 
 if __name__ == "__main__":
     import uvicorn
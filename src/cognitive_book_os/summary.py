@@ -1,6 +1,7 @@
 """Summary system - generate lightweight maps of knowledge."""
 
 import yaml
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from rich.console import Console
 from rich.table import Table
@@ -50,11 +51,12 @@ def summarize_topic(
     table.add_column("Synopsis", width=50)
     table.add_column("Related To", style="dim")
     
-    for relative_path in files:
-        if not relative_path.endswith(".md"):
-            continue
-            
-        content = brain.read_file(relative_path)
+    md_files = [relative_path for relative_path in files if relative_path.endswith(".md")]
+    # Overlap the file reads; parsing and table rows stay in order below
+    with ThreadPoolExecutor(max_workers=max(1, min(8, len(md_files)))) as executor:
+        contents = list(executor.map(brain.read_file, md_files))
+
+    for relative_path, content in zip(md_files, contents):
         if not content:
             continue
             
@@ -71,13 +73,12 @@ def summarize_topic(
                 # Get Synopsis from frontmatter OR content
                 synopsis = frontmatter.get("summary")
                 if not synopsis:
-                    # heuristic: look for **Synopsis**: in body
-                    if "**Synopsis**:" in body:
-                        parts = body.split("**Synopsis**:", 1)[1]
-                        synopsis = parts.split("\n", 1)[0].strip()
-                    elif "**Summary**:" in body:
-                        parts = body.split("**Summary**:", 1)[1]
-                        synopsis = parts.split("\n", 1)[0].strip()
+                    # heuristic: look for **Synopsis**: (then **Summary**:) in body
+                    _, sep, tail = body.partition("**Synopsis**:")
+                    if not sep:
+                        _, sep, tail = body.partition("**Summary**:")
+                    if sep:
+                        synopsis = tail.partition("\n")[0].strip()
                     else:
                         # First non-empty line after title
                         lines = [l.strip() for l in body.split("\n") if l.strip() and not l.strip().startswith("#")]
@@ -1,5 +1,7 @@
 """Verification system - test hypotheses against the brain."""
 
+from concurrent.futures import ThreadPoolExecutor
+
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
@@ -43,12 +45,18 @@ def verify_claim(
     # Pass 1: Supporting Evidence
     console.print("[dim]Pass 1: Hunting for SUPPORTING evidence...[/dim]")
     support_query = f"Find evidence that SUPPORTS the claim: '{claim}'"
-    support_files = select_relevant_files(support_query, brain, client).files
     
     # Pass 2: Conflicting Evidence
     console.print("[dim]Pass 2: Hunting for CONFLICTING evidence...[/dim]")
     refute_query = f"Find evidence that REFUTES or CONTRADICTS the claim: '{claim}'"
-    refute_files = select_relevant_files(refute_query, brain, client).files
+    
+    # The two passes are independent LLM calls over the same file list; overlap them.
+    brain_files = brain.list_files()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        support_future = executor.submit(select_relevant_files, support_query, brain, client, brain_files)
+        refute_future = executor.submit(select_relevant_files, refute_query, brain, client, brain_files)
+        support_files = support_future.result().files
+        refute_files = refute_future.result().files
     
     # Combine unique files
     all_files = sorted(list(set(support_files + refute_files)))
@@ -7,35 +7,44 @@ from pathlib import Path
 from rich.console import Console
 import yaml
 import re
+from functools import lru_cache
 
 from .brain import Brain
 
 console = Console()
 
+# Matches [[link]] or [[link|alias]]
+_WIKI_LINK_RE = re.compile(r"\[\[([^\]|]+)(?:\|[^\]]+)?\]\]")
+# libyaml-backed loader when available; frontmatter parsing is the hot path
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 def extract_related_links(content: str) -> list[str]:
     """Extract related links from YAML frontmatter."""
+    if content.startswith("---"):
+        end = content.find("---", 3)
+        if end != -1:
+            return list(_parse_related_links(content[3:end]))
+    return []
+
+@lru_cache(maxsize=1024)
+def _parse_related_links(frontmatter: str) -> tuple:
+    """Parse the 'related' list from frontmatter; memoized per frontmatter text."""
     try:
-        if content.startswith("---"):
-            end = content.find("---", 3)
-            if end != -1:
-                frontmatter = content[3:end]
-                data = yaml.safe_load(frontmatter)
-                if data and "related" in data:
-                    related = data["related"]
-                    if isinstance(related, list):
-                        return related
-                    elif isinstance(related, str):
-                        # Handle basic list strings if LLM messed up YAML
-                        return [r.strip() for r in related.strip("[]").split(",")]
+        data = yaml.load(frontmatter, Loader=_YAML_LOADER)
+        if data and "related" in data:
+            related = data["related"]
+            if isinstance(related, list):
+                return tuple(related)
+            elif isinstance(related, str):
+                # Handle basic list strings if LLM messed up YAML
+                return tuple(r.strip() for r in related.strip("[]").split(","))
     except Exception:
         pass
-    return []
+    return ()
 
 def extract_wiki_links(content: str) -> list[str]:
     """Extract [[wiki-links]] from markdown content."""
-    # Matches [[link]] or [[link|alias]]
-    matches = re.findall(r"\[\[([^\]|]+)(?:\|[^\]]+)?\]\]", content)
-    return matches
+    return _WIKI_LINK_RE.findall(content)
 
 def generate_graph(brain_name: str, output_file: str = "graph.html"):
     """
@@ -29,6 +29,15 @@ class TestBrainFileOperations:
             read_content = brain.read_file("characters/john-doe.md")
             assert read_content == content
 
+    def test_write_file_accepts_utf8_bytes(self):
+        """Test that pre-encoded content is written unchanged."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            brain = Brain("test-brain", base_path=tmpdir)
+
+            brain.write_file("meta/report.json", '{"name": "café"}'.encode("utf-8"))
+
+            assert brain.read_file("meta/report.json") == '{"name": "café"}'
+
     def test_read_nonexistent_file_returns_none(self):
         """Test that reading missing file returns None instead of error."""
         with tempfile.TemporaryDirectory() as tmpdir:
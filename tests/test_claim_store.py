@@ -3,10 +3,12 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from cognitive_book_os.brain import Brain
-from cognitive_book_os.claim_store import ClaimStore
+from cognitive_book_os.claim_store import ClaimStore, claim_cursor
 from cognitive_book_os.models import ClaimStatus, QueryResult
 
 
@@ -109,3 +111,25 @@ def test_build_query_audit_links_claim_trace(tmp_path):
     claim_id = audit.claim_trace[0].claim_id
     history = store.get_claim_history(claim_id)
     assert any(event.event_type == "claim_cited_in_answer" for event in history)
+
+
+def test_list_claims_pages_with_keyset_cursor(tmp_path):
+    brain = Brain("claim-brain-pages", base_path=tmp_path)
+    brain.initialize("Page claims")
+
+    store = ClaimStore(brain)
+    for index in range(3):
+        store.track_file_claims(
+            file_path=f"facts/sample_{index}.md",
+            content=_sample_content(f"Claim {index} has paging details.", f"Quote {index}"),
+            run_id=f"ingest_page_{index}",
+        )
+
+    everything = store.list_claims(limit=10)
+    first_page = store.list_claims(limit=2)
+    second_page = store.list_claims(limit=2, after=claim_cursor(first_page[-1]))
+
+    assert len(everything) == 3
+    assert first_page + second_page == everything
+    with pytest.raises(ValueError):
+        store.list_claims(after="not-a-cursor")
@@ -1,7 +1,7 @@
 
 import pytest
 from unittest.mock import MagicMock, patch
-from cognitive_book_os.llm import LLMClient, _convert_tools_to_anthropic, _to_openai_tool_calls
+from cognitive_book_os.llm import LLMClient, _convert_tools_to_anthropic, _to_openai_tool_calls, get_client
 
 def test_convert_tools_to_anthropic():
     # Input: OpenAI format
@@ -49,3 +49,60 @@ def test_llm_client_init_anthropic(mock_instructor, mock_anthropic):
     assert client.provider == "anthropic"
     mock_anthropic.assert_called()
     mock_instructor.assert_called()
+
+@patch("cognitive_book_os.llm.Anthropic")
+@patch("cognitive_book_os.llm.instructor.from_anthropic")
+def test_generate_marks_cached_prefix_for_anthropic(mock_instructor, mock_anthropic):
+    client = LLMClient(provider="anthropic")
+    create_partial = mock_instructor.return_value.chat.completions.create_partial
+    create_partial.side_effect = RuntimeError("no stream")
+
+    client.generate(MagicMock(), "system", "question", cached_prefix="file list")
+
+    messages = mock_instructor.return_value.chat.completions.create.call_args.kwargs["messages"]
+    assert messages[1]["content"] == [
+        {"type": "text", "text": "file list", "cache_control": {"type": "ephemeral"}},
+        {"type": "text", "text": "question"},
+    ]
+
+@patch("cognitive_book_os.llm.OpenAI")
+@patch("cognitive_book_os.llm.instructor.from_openai")
+def test_generate_puts_cached_prefix_first_for_openai(mock_instructor, mock_openai):
+    client = LLMClient(provider="openai")
+
+    client.generate(MagicMock(), "system", "question", cached_prefix="file list")
+
+    messages = mock_instructor.return_value.chat.completions.create.call_args.kwargs["messages"]
+    assert messages[1]["content"] == "file list\nquestion"
+
+@patch("cognitive_book_os.llm.Anthropic")
+@patch("cognitive_book_os.llm.instructor.from_anthropic")
+def test_generate_reports_partials_while_streaming(mock_instructor, mock_anthropic):
+    from cognitive_book_os.models import QueryResult
+
+    client = LLMClient(provider="anthropic")
+    partials = [
+        QueryResult.model_construct(answer="The"),
+        QueryResult(answer="The answer", sources=[], confidence="high"),
+    ]
+    mock_instructor.return_value.chat.completions.create_partial.return_value = iter(partials)
+    seen = []
+
+    result = client.generate(QueryResult, "system", "question", on_partial=seen.append)
+
+    assert seen == partials
+    assert result.answer == "The answer"
+
+@patch("cognitive_book_os.llm.OpenAI")
+@patch("cognitive_book_os.llm.instructor.from_openai")
+def test_get_client_reuses_one_sdk_client(mock_instructor, mock_openai):
+    get_client.cache_clear()
+    try:
+        first = get_client(provider="openai", model="gpt-test")
+        second = get_client(provider="openai", model="gpt-test")
+    finally:
+        get_client.cache_clear()
+
+    assert first is second
+    mock_openai.assert_called_once()
+    assert first._raw_client is mock_instructor.call_args.args[0]
@@ -7,9 +7,11 @@ import pytest
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+from cognitive_book_os import parser as parser_module
 from cognitive_book_os.parser import (
     split_into_chunks,
     detect_chapters,
+    stream_chapters,
     chunk_document,
     extract_pages_from_pdf,
 )
@@ -72,6 +74,20 @@ class TestExtractPagesFromPDF:
         assert pages[0][0] == 1  # Page number
         assert "Only one page" in pages[0][1]  # Content
 
+    def test_extract_pages_keeps_order_for_large_pdf(self, tmp_path):
+        """Test that large PDFs extracted in parallel keep page order."""
+        pdf_path = tmp_path / "large.pdf"
+        doc = fitz.open()
+        for i in range(40):
+            doc.new_page().insert_text((50, 50), f"Page {i + 1} body")
+        doc.save(pdf_path)
+        doc.close()
+
+        pages = extract_pages_from_pdf(pdf_path)
+
+        assert [page_num for page_num, _ in pages] == list(range(1, 41))
+        assert all(f"Page {num} body" in text for num, text in pages)
+
 
 class TestSplitIntoChunks:
     """Tests for text chunking functionality."""
@@ -212,6 +228,24 @@ More content.
         # Default title is "Full Document" or chapter 0 (based on code inspection)
         assert "regular text" in chapters[0].content
 
+    def test_stream_chapters_matches_detect_on_joined_pages(self):
+        """Test that streaming over pages gives the same chapters as the joined text."""
+        pages = [
+            (1, "Preface text.\nChapter 1: Start\nFirst body."),
+            (2, "More of the first chapter."),
+            (3, "Chapter 2: Finish\nLast body."),
+        ]
+
+        streamed = list(stream_chapters(pages))
+        joined = detect_chapters("\n".join(text for _, text in pages))
+
+        assert [(c.number, c.title, c.content) for c in streamed] == [
+            (c.number, c.title, c.content) for c in joined
+        ]
+        assert [c.title for c in streamed] == ["Introduction", "Start", "Finish"]
+        assert "More of the first chapter." in streamed[1].content
+        assert [(c.start_page, c.end_page) for c in streamed] == [(1, 1), (1, 2), (3, 3)]
+
 
 class TestChunkDocument:
     """Tests for PDF document chunking - the main entry point users rely on."""
@@ -266,3 +300,16 @@ The final chapter wraps up our test document with concluding remarks."""
         assert "introduction to our test document" in full_content.lower()
         assert "intelligently detect chapter boundaries" in full_content.lower()
 
+
+def test_pdfium_backend_falls_back_with_warning_when_missing(monkeypatch, caplog):
+    """PDF_BACKEND=pdfium without pypdfium2 installed logs once and uses PyMuPDF."""
+    monkeypatch.setenv("PDF_BACKEND", "pdfium")
+    monkeypatch.setattr(parser_module.importlib.util, "find_spec", lambda name: None)
+    monkeypatch.setattr(parser_module, "_pdfium_missing_warned", False)
+
+    with caplog.at_level("WARNING", logger="cognitive_book_os.parser"):
+        assert parser_module._use_pdfium_backend() is False
+        assert parser_module._use_pdfium_backend() is False
+
+    warnings = [r for r in caplog.records if "pypdfium2 is not installed" in r.message]
+    assert len(warnings) == 1
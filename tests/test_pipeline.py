@@ -0,0 +1,176 @@
+"""Tests for ingestion strategy triage."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from cognitive_book_os.brain import Brain
+from cognitive_book_os.models import ChapterStatus
+from cognitive_book_os.pipeline import (
+    TRIAGE_PREVIEW_CHARS,
+    TRIAGE_RELEVANT_HITS,
+    BatchTriageDecision,
+    ChapterTriageDecision,
+    TriageDecision,
+    TriageStrategy,
+)
+
+
+class _RecordingClient:
+    """Fake LLM client that records prompts and replies with canned decisions."""
+
+    def __init__(self, decision=None, batch=None):
+        self.calls = []
+        self.decision = decision
+        self.batch = batch or BatchTriageDecision(decisions=[])
+
+    def generate(self, response_model, system_prompt, user_prompt, temperature):
+        self.calls.append((response_model, user_prompt))
+        if response_model is BatchTriageDecision:
+            return self.batch
+        return self.decision
+
+
+def test_keyword_skip_records_chapter_topics_as_reason(tmp_path):
+    brain = Brain("triage-brain", base_path=tmp_path)
+    brain.initialize("Rocket engines")
+    client = _RecordingClient()
+    strategy = TriageStrategy()
+    content = "Gardening notes. Tomatoes need sun; tomatoes need water. Basil grows near tomatoes."
+
+    state = strategy.process_chapter(content, "Garden", 3, brain, client, objective="How do rocket engines work?")
+
+    assert state.status == ChapterStatus.SKIPPED
+    assert state.reason.startswith("Off-objective; covers tomatoes")
+    assert "basil" in state.reason
+    assert "keyword" not in state.reason and "found" not in state.reason
+    assert client.calls == []
+
+
+def test_short_objective_tokens_do_not_count_as_hits():
+    strategy = TriageStrategy()
+
+    decision = strategy._keyword_decision("He went up to the hill in AI mode.", "AI go up?")
+
+    # Every objective token is under three characters, so there is nothing to match on
+    assert decision is None
+
+
+def test_keyword_auto_relevant_needs_distinct_terms():
+    strategy = TriageStrategy()
+    terms = [f"topic{i}" for i in range(TRIAGE_RELEVANT_HITS)]
+    objective = " ".join(terms)
+
+    repeated = strategy._keyword_decision(" ".join([terms[0]] * 50), objective)
+    distinct = strategy._keyword_decision(" ".join(terms), objective)
+
+    assert repeated is None
+    assert distinct is not None and distinct.is_relevant
+
+
+def test_keyword_prefilter_matches_singular_and_plural_forms():
+    strategy = TriageStrategy()
+
+    decision = strategy._keyword_decision(
+        "The engine mixes fuel and oxidizer before ignition.",
+        "How do rocket engines work?",
+    )
+
+    # "engine" matches the objective's "engines", so the chapter is not dropped
+    assert decision is None
+
+
+def test_keyword_auto_relevant_scales_to_short_objectives():
+    strategy = TriageStrategy()
+
+    decision = strategy._keyword_decision(
+        "Each rocket engine works by burning propellant and expelling exhaust.",
+        "How do rocket engines work?",
+    )
+
+    assert decision is not None and decision.is_relevant
+    assert decision.reasoning == "3 objective terms present"
+
+
+def test_ambiguous_chapter_falls_back_to_llm_triage(tmp_path):
+    brain = Brain("triage-brain", base_path=tmp_path)
+    brain.initialize("Rocket engines")
+    client = _RecordingClient(decision=TriageDecision(is_relevant=False, reasoning="Only mentions rockets in passing"))
+    strategy = TriageStrategy()
+
+    state = strategy.process_chapter(
+        "A rocket appears once in this story about a picnic.",
+        "Picnic",
+        4,
+        brain,
+        client,
+        objective="How do rocket engines work?",
+    )
+
+    assert [model for model, _ in client.calls] == [TriageDecision]
+    assert state.status == ChapterStatus.SKIPPED
+    assert state.reason == "Only mentions rockets in passing"
+
+
+OBJECTIVE = "How do rocket engines work?"
+
+
+def test_prepare_maps_batch_decisions_to_chapters(tmp_path):
+    brain = Brain("triage-brain", base_path=tmp_path)
+    brain.initialize("Rocket engines")
+    client = _RecordingClient(batch=BatchTriageDecision(decisions=[
+        ChapterTriageDecision(chapter_num=1, is_relevant=True, reasoning="Covers thrust"),
+        ChapterTriageDecision(chapter_num=2, is_relevant=False, reasoning="Crew biographies"),
+        ChapterTriageDecision(chapter_num=99, is_relevant=True, reasoning="Not in this batch"),
+    ]))
+    strategy = TriageStrategy()
+    chapters = [
+        (1, "Thrust", "A rocket pushes exhaust backwards."),
+        (2, "Crew", "The rocket crew grew up in small towns."),
+    ]
+
+    strategy.prepare(chapters, client, objective=OBJECTIVE)
+
+    assert [model for model, _ in client.calls] == [BatchTriageDecision]
+    assert set(strategy._decisions) == {1, 2}
+    assert strategy._decisions[1].is_relevant
+    state = strategy.process_chapter(chapters[1][2], "Crew", 2, brain, client, objective=OBJECTIVE)
+    assert state.status == ChapterStatus.SKIPPED
+    assert state.reason == "Crew biographies"
+    assert len(client.calls) == 1
+
+
+def test_prepare_leaves_missing_chapters_to_per_chapter_triage(tmp_path):
+    brain = Brain("triage-brain", base_path=tmp_path)
+    brain.initialize("Rocket engines")
+    client = _RecordingClient(
+        decision=TriageDecision(is_relevant=False, reasoning="Triaged on its own"),
+        batch=BatchTriageDecision(decisions=[
+            ChapterTriageDecision(chapter_num=1, is_relevant=False, reasoning="Batched"),
+        ]),
+    )
+    strategy = TriageStrategy()
+    chapters = [
+        (1, "Launch", "A rocket launch in the rain."),
+        (2, "Landing", "A rocket lands on a barge."),
+    ]
+
+    strategy.prepare(chapters, client, objective=OBJECTIVE)
+    state = strategy.process_chapter(chapters[1][2], "Landing", 2, brain, client, objective=OBJECTIVE)
+
+    assert [model for model, _ in client.calls] == [BatchTriageDecision, TriageDecision]
+    assert state.reason == "Triaged on its own"
+
+
+def test_prepare_sends_truncated_previews():
+    client = _RecordingClient()
+    strategy = TriageStrategy()
+    head = "rocket " + "a" * (TRIAGE_PREVIEW_CHARS - len("rocket "))
+    content = head + "TAIL_MARKER" * 20
+
+    strategy.prepare([(1, "Long", content)], client, objective=OBJECTIVE)
+
+    (_, user_prompt), = client.calls
+    assert f"### Chapter 1: Long\n{head} ... (truncated)" in user_prompt
+    assert "TAIL_MARKER" not in user_prompt
@@ -97,3 +97,21 @@ class TestPromptContext:
             result = get_prompt_with_context("extract", objective="Test objective")
             assert "Test objective" in result
             assert "{objective}" not in result
+
+    def test_get_prompt_with_context_single_pass(self, tmp_path, monkeypatch):
+        """Test that substitution is one pass and leaves unknown placeholders."""
+        import cognitive_book_os.prompts as prompts_module
+
+        (tmp_path / "greeting.md").write_text(
+            "Hello {name}, goal: {objective}. Keep {unknown}.", encoding="utf-8"
+        )
+        monkeypatch.setattr(prompts_module, "PROMPTS_DIR", tmp_path)
+        load_prompt.cache_clear()
+        try:
+            result = get_prompt_with_context(
+                "greeting", name="{objective}", objective="learn"
+            )
+        finally:
+            load_prompt.cache_clear()
+
+        assert result == "Hello {objective}, goal: learn. Keep {unknown}."
@@ -0,0 +1,131 @@
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from cognitive_book_os import query as query_module
+from cognitive_book_os.brain import Brain
+from cognitive_book_os.models import Confidence, QueryResult
+
+
+def test_tfidf_scores_prefer_documents_matching_the_question():
+    scores = query_module._tfidf_scores(
+        "Who founded Rome?",
+        [
+            "Romulus founded Rome after a quarrel with Remus.",
+            "Carthage was a rival city across the sea.",
+            "",
+        ],
+    )
+
+    assert scores[0] > scores[1] == 0.0
+    assert scores[2] == 0.0
+
+
+def test_answer_keeps_selected_files_and_best_linked_files(tmp_path, monkeypatch):
+    brain = Brain(name="test", base_path=tmp_path)
+    brain.initialize("Objective")
+    links = "\n".join(f"  - \"[[topics/t{i}.md]]\"" for i in range(4))
+    brain.write_file("characters/hero.md", f"---\nrelated:\n{links}\n---\nThe hero.")
+    for i in range(4):
+        body = "dragon lair" if i == 2 else f"unrelated topic {i}"
+        brain.write_file(f"topics/t{i}.md", body)
+    monkeypatch.setattr(query_module, "ANSWER_MAX_LINKED_FILES", 1)
+
+    class FakeClient:
+        def generate(self, response_model, system_prompt, user_prompt, temperature):
+            self.context = user_prompt
+            return QueryResult(answer="ok", sources=[], confidence=Confidence.HIGH)
+
+    client = FakeClient()
+    result, used_files = query_module._generate_answer_from_selection(
+        "Where is the dragon lair?", brain, ["characters/hero.md"], client
+    )
+
+    assert result.answer == "ok"
+    assert used_files == ["characters/hero.md", "topics/t2.md"]
+    assert "### topics/t0.md" not in client.context
+    assert "### topics/t2.md" in client.context
+
+
+def test_answer_returns_only_files_that_fit_the_context_budget(tmp_path, monkeypatch):
+    brain = Brain(name="test", base_path=tmp_path)
+    brain.initialize("Objective")
+    brain.write_file("facts/a.md", "a" * 40)
+    brain.write_file("facts/b.md", "b" * 40)
+    monkeypatch.setattr(query_module, "ANSWER_CONTEXT_MAX_CHARS", 60)
+
+    class FakeClient:
+        def generate(self, response_model, system_prompt, user_prompt, temperature, cached_prefix=None):
+            self.prompt = (cached_prefix or "") + user_prompt
+            return QueryResult(answer="ok", sources=[], confidence=Confidence.HIGH)
+
+    client = FakeClient()
+    _, used_files = query_module._generate_answer_from_selection(
+        "What?", brain, ["facts/a.md", "facts/b.md"], client
+    )
+
+    assert used_files == ["facts/a.md"]
+    assert "### facts/b.md" not in client.prompt
+
+
+def test_answer_handles_duplicate_selected_files(tmp_path, monkeypatch):
+    brain = Brain(name="test", base_path=tmp_path)
+    brain.initialize("Objective")
+    links = "\n".join(f"  - \"[[topics/t{i}.md]]\"" for i in range(3))
+    brain.write_file("characters/hero.md", f"---\nrelated:\n{links}\n---\nThe hero.")
+    for i in range(3):
+        brain.write_file(f"topics/t{i}.md", "dragon lair" if i == 1 else f"unrelated topic {i}")
+    monkeypatch.setattr(query_module, "ANSWER_MAX_LINKED_FILES", 1)
+
+    class FakeClient:
+        def generate(self, response_model, system_prompt, user_prompt, temperature, cached_prefix=None):
+            return QueryResult(answer="ok", sources=[], confidence=Confidence.HIGH)
+
+    _, used_files = query_module._generate_answer_from_selection(
+        "Where is the dragon lair?", brain, ["characters/hero.md", "characters/hero.md"], FakeClient()
+    )
+
+    assert used_files == ["characters/hero.md", "topics/t1.md"]
+
+
+def test_auto_enrich_skips_gap_detection_for_confident_answers(tmp_path, monkeypatch):
+    brain = Brain(name="test", base_path=tmp_path)
+    brain.initialize("Objective")
+
+    class FakeClient:
+        provider = "anthropic"
+        model = "m1"
+
+    def _unexpected_gap(self, query, provider, model):
+        raise AssertionError("evaluate_gap should not run for a confident answer")
+
+    monkeypatch.setattr(query_module, "get_client", lambda provider, model: FakeClient())
+    monkeypatch.setattr(
+        query_module,
+        "answer_one_shot",
+        lambda question, brain, client, all_files=None, on_partial=None: QueryResult(
+            answer="Known", sources=[], confidence=Confidence.HIGH
+        ),
+    )
+    monkeypatch.setattr(query_module.EnrichmentManager, "evaluate_gap", _unexpected_gap)
+
+    answer = query_module.query_brain("test", "What?", brains_dir=str(tmp_path), auto_enrich=True)
+
+    assert answer == "Known"
+
+
+def test_one_shot_checks_sizes_before_reading_files(tmp_path, monkeypatch):
+    brain = Brain(name="test", base_path=tmp_path)
+    brain.initialize("Objective")
+    brain.write_file("facts/big.md", "x" * 200)
+    brain.write_file("facts/small.md", "y")
+    monkeypatch.setattr(query_module, "ONE_SHOT_MAX_CHARS", 100)
+
+    def _unexpected_read(brain, file_paths):
+        raise AssertionError("files should not be read for an oversized brain")
+
+    monkeypatch.setattr(query_module, "_read_files", _unexpected_read)
+
+    assert query_module.answer_one_shot("What?", brain, client=None) is None
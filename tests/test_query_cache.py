@@ -0,0 +1,103 @@
+"""Tests for the per-brain query answer cache."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from cognitive_book_os.brain import Brain
+from cognitive_book_os.models import Confidence, QueryResult
+from cognitive_book_os.query_cache import QUERY_CACHE_FILE, QueryCache, query_cache_enabled
+
+
+def _result(answer: str, confidence: Confidence = Confidence.HIGH) -> QueryResult:
+    return QueryResult(answer=answer, sources=["facts/launch.md"], confidence=confidence)
+
+
+def test_lookup_matches_only_the_same_normalized_question(tmp_path):
+    brain = Brain("cache-brain", base_path=tmp_path)
+    brain.initialize("Cache answers")
+    brain.write_file("facts/launch.md", "# Launch\n\nThe window opens at 0900 UTC.\n")
+
+    cache = QueryCache(brain)
+    cache.store("When does the launch window open?", "anthropic", "m1", _result("0900 UTC"))
+
+    hit = cache.lookup("when does the launch  window open", "anthropic", "m1")
+    assert hit is not None
+    assert hit.answer == "0900 UTC"
+    assert cache.lookup("When does the launch window open?", "openai", "m1") is None
+    assert cache.lookup("Who leads the mission?", "anthropic", "m1") is None
+    # Sharing almost every word is not enough: these ask different things
+    assert cache.lookup("When does the launch window not open?", "anthropic", "m1") is None
+    assert cache.lookup("Does the launch window open when?", "anthropic", "m1") is None
+
+
+def test_cache_file_is_not_listed_as_brain_content(tmp_path):
+    brain = Brain("cache-brain", base_path=tmp_path)
+    brain.initialize("Cache answers")
+    files_before = brain.list_files()
+
+    QueryCache(brain).store("When?", "anthropic", "m1", _result("0900 UTC"))
+
+    assert (brain.path / QUERY_CACHE_FILE).exists()
+    assert brain.list_files() == files_before
+
+
+def test_query_cache_is_disabled_by_default(monkeypatch):
+    monkeypatch.delenv("ENABLE_QUERY_CACHE", raising=False)
+    assert query_cache_enabled() is False
+    monkeypatch.setenv("ENABLE_QUERY_CACHE", "1")
+    assert query_cache_enabled() is True
+
+
+def test_cache_invalidated_when_knowledge_files_change(tmp_path):
+    brain = Brain("cache-brain", base_path=tmp_path)
+    brain.initialize("Cache answers")
+    brain.write_file("facts/launch.md", "# Launch\n\nThe window opens at 0900 UTC.\n")
+
+    cache = QueryCache(brain)
+    cache.store("When does the launch window open?", "anthropic", "m1", _result("0900 UTC"))
+    brain.write_file("notes/correction.md", "# Note\n\nThe window moved to 1000 UTC.\n")
+
+    assert cache.lookup("When does the launch window open?", "anthropic", "m1") is None
+
+
+def test_low_confidence_answers_are_not_cached(tmp_path):
+    brain = Brain("cache-brain", base_path=tmp_path)
+    brain.initialize("Cache answers")
+
+    cache = QueryCache(brain)
+    cache.store("Unknown question?", "anthropic", "m1", _result("Not sure", Confidence.LOW))
+
+    assert cache.lookup("Unknown question?", "anthropic", "m1") is None
+
+
+def test_cache_invalidated_when_knowledge_file_is_renamed(tmp_path):
+    brain = Brain("cache-brain", base_path=tmp_path)
+    brain.initialize("Cache answers")
+    brain.write_file("facts/launch.md", "# Launch\n\nThe window opens at 0900 UTC.\n")
+
+    cache = QueryCache(brain)
+    cache.store("When does the launch window open?", "anthropic", "m1", _result("0900 UTC"))
+    (brain.path / "facts" / "launch.md").rename(brain.path / "facts" / "scrubbed_launch.md")
+
+    assert cache.lookup("When does the launch window open?", "anthropic", "m1") is None
+
+
+def test_fingerprint_skips_files_deleted_mid_scan(tmp_path, monkeypatch):
+    brain = Brain("cache-brain", base_path=tmp_path)
+    brain.initialize("Cache answers")
+    brain.write_file("facts/gone.md", "# Gone\n")
+    gone = brain.path / "facts" / "gone.md"
+    count_before = int(QueryCache(brain).fingerprint().split(":")[0])
+    original_stat = Path.stat
+
+    def _racing_stat(self, *args, **kwargs):
+        if self == gone:
+            raise FileNotFoundError(self)
+        return original_stat(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "stat", _racing_stat)
+
+    count = QueryCache(brain).fingerprint().split(":")[0]
+    assert int(count) == count_before - 1
@@ -2,10 +2,16 @@
 
 import sys
 import io
+import json
+import os
+import shutil
+import time
 import subprocess
 import sqlite3
+from collections import Counter
 from pathlib import Path
 
+import pytest
 from fastapi.testclient import TestClient
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
@@ -18,6 +24,7 @@ from cognitive_book_os.models import (
     FileSelection,
     MultiBrainQueryResult,
     QueryAuditResult,
+    QueryResult,
     TraceabilitySummary,
 )
 
@@ -56,12 +63,12 @@ def _make_test_client(tmp_path, monkeypatch) -> TestClient:
         server_module._operational_metrics.update({
             "started_at": "2026-01-01T00:00:00",
             "requests_total": 0,
-            "responses_by_status": {},
-            "requests_by_method": {},
-            "requests_by_path": {},
+            "responses_by_status": Counter(),
+            "requests_by_method": Counter(),
+            "requests_by_path": Counter(),
             "auth_failures": 0,
             "rate_limited": 0,
-            "latency_ms": {"count": 0, "sum": 0.0, "max": 0.0},
+            "latency_ns": {"count": 0, "sum": 0, "max": 0},
         })
     return TestClient(server_module.app)
 
@@ -103,6 +110,22 @@ def test_readiness_check_reports_degraded_when_sqlite_unavailable(tmp_path, monk
     assert payload["checks"]["job_store"]["ok"] is False
 
 
+def test_readiness_check_uses_read_only_sqlite_connection(tmp_path, monkeypatch):
+    """Readiness should probe SQLite through a separate read-only connection."""
+    client = _make_test_client(tmp_path, monkeypatch)
+    monkeypatch.setattr(server_module, "JOB_STORE_BACKEND", "sqlite")
+
+    response = client.get("/health/ready")
+    assert response.status_code == 200
+    assert response.json()["checks"]["job_store"]["backend"] == "sqlite"
+
+    reader = server_module._sqlite_reader
+    assert reader is not None and reader is not server_module._sqlite_conn
+    with pytest.raises(sqlite3.OperationalError):
+        reader.execute("DELETE FROM job_store")
+    server_module.close_job_store()
+
+
 def test_metrics_endpoint_tracks_requests(tmp_path, monkeypatch):
     """Metrics endpoint should expose aggregated request/latency counters."""
     client = _make_test_client(tmp_path, monkeypatch)
@@ -118,6 +141,28 @@ def test_metrics_endpoint_tracks_requests(tmp_path, monkeypatch):
     assert payload["latency_ms"]["count"] >= 2
 
 
+def test_metrics_counts_paths_statuses_and_rejections(tmp_path, monkeypatch):
+    """Metrics should count per path/status, fold overflow paths and count auth failures."""
+    client = _make_test_client(tmp_path, monkeypatch)
+    monkeypatch.setattr(server_module, "METRICS_MAX_PATHS", 1)
+    client.get("/health")
+    client.get("/health")
+    client.get("/brains/missing-brain")
+    monkeypatch.setattr(server_module, "REQUIRE_API_KEY", "secret")
+    client.get("/health")
+
+    with server_module._metrics_lock:
+        metrics = server_module._operational_metrics
+        assert metrics["requests_total"] == 4
+        assert metrics["requests_by_path"] == {"/health": 3, "__other__": 1}
+        assert metrics["responses_by_status"]["200"] == 2
+        assert metrics["responses_by_status"]["401"] == 1
+        assert metrics["auth_failures"] == 1
+        assert metrics["latency_ns"]["count"] == 4
+        assert isinstance(metrics["latency_ns"]["sum"], int)
+        assert metrics["latency_ns"]["max"] >= metrics["latency_ns"]["sum"] / 4
+
+
 def test_metrics_endpoint_requires_metrics_key_when_configured(tmp_path, monkeypatch):
     """Metrics endpoint should require x-metrics-key when METRICS_API_KEY is set."""
     client = _make_test_client(tmp_path, monkeypatch)
@@ -260,6 +305,38 @@ def test_middleware_emits_structured_request_log(tmp_path, monkeypatch, caplog):
     )
 
 
+def test_request_log_caps_path_and_skips_when_info_disabled(tmp_path, monkeypatch, caplog):
+    """Request logs should truncate long paths and cost nothing above INFO."""
+    client = _make_test_client(tmp_path, monkeypatch)
+    monkeypatch.setattr(server_module, "REQUEST_LOG_MAX_PATH_CHARS", 10)
+
+    caplog.set_level("INFO", logger="cognitive_book_os.server")
+    client.get("/brains/" + "x" * 50)
+    assert any("\"path\": \"/brains/xx...\"" in record.message for record in caplog.records)
+
+    caplog.clear()
+    caplog.set_level("WARNING", logger="cognitive_book_os.server")
+    client.get("/health")
+    assert not any("http_request" in record.message for record in caplog.records)
+
+
+def test_probe_path_bypass_skips_metrics_and_logs(tmp_path, monkeypatch, caplog):
+    """With PROBE_PATH_BYPASS, probes should not be logged or counted per path."""
+    client = _make_test_client(tmp_path, monkeypatch)
+    monkeypatch.setattr(server_module, "PROBE_PATH_BYPASS", True)
+    monkeypatch.setattr(server_module, "_probe_hits", 0)
+    caplog.set_level("INFO", logger="cognitive_book_os.server")
+
+    response = client.get("/health")
+    assert response.status_code == 200
+    assert response.headers.get("x-request-id")
+    assert not any("http_request" in record.message for record in caplog.records)
+
+    payload = client.get("/metrics").json()
+    assert payload["requests_total"] == 0
+    assert payload["probe_requests"] == 2
+
+
 def test_api_key_middleware_blocks_unauthorized(tmp_path, monkeypatch):
     """When configured, API key middleware should reject missing/invalid keys."""
     client = _make_test_client(tmp_path, monkeypatch)
@@ -288,6 +365,38 @@ def test_rate_limit_middleware_enforces_limit(tmp_path, monkeypatch):
     assert third.headers.get("x-request-id")
 
 
+def test_rate_limit_sliding_window_weights_previous_minute(monkeypatch):
+    """Requests from the previous minute should count in proportion to their overlap."""
+    monkeypatch.setattr(server_module, "RATE_LIMIT_PER_MINUTE", 2)
+    server_module.rate_limit_store.clear()
+
+    assert server_module._rate_limit_allows("1.2.3.4", 600.0, 10)
+    assert server_module._rate_limit_allows("1.2.3.4", 610.0, 10)
+    assert not server_module._rate_limit_allows("1.2.3.4", 620.0, 10)
+
+    # Halfway into the next minute the two earlier requests weigh as one
+    assert server_module._rate_limit_allows("1.2.3.4", 690.0, 11)
+    assert not server_module._rate_limit_allows("1.2.3.4", 690.0, 11)
+
+    # A gap of more than a minute forgets the old counts
+    assert server_module._rate_limit_allows("1.2.3.4", 800.0, 13)
+    server_module.rate_limit_store.clear()
+
+
+def test_rate_limit_store_evicts_least_recent_clients(monkeypatch):
+    """Rate limiter should keep at most RATE_LIMIT_MAX_CLIENTS hosts."""
+    monkeypatch.setattr(server_module, "RATE_LIMIT_PER_MINUTE", 5)
+    monkeypatch.setattr(server_module, "RATE_LIMIT_MAX_CLIENTS", 2)
+    server_module.rate_limit_store.clear()
+
+    for host in ("a", "b", "a", "c"):
+        server_module._rate_limit_allows(host, 600.0, 10)
+
+    assert list(server_module.rate_limit_store) == ["a", "c"]
+    assert server_module.rate_limit_store["a"] == (10, 0, 2)
+    server_module.rate_limit_store.clear()
+
+
 def test_trim_job_history_keeps_recent_entries():
     """Job store should be capped to configured history size."""
     store = {
@@ -301,6 +410,18 @@ def test_trim_job_history_keeps_recent_entries():
     assert "j2" in store and "j3" in store
 
 
+def test_trim_job_history_evicts_finished_jobs_before_processing_ones():
+    """A long-running job should not lose its record to newer finished jobs."""
+    store = {
+        "running": {"started_at": "2026-01-01T00:00:00", "status": "processing"},
+        "done_1": {"started_at": "2026-01-01T00:00:01", "status": "completed"},
+        "done_2": {"started_at": "2026-01-01T00:00:02", "status": "failed"},
+    }
+    removed = server_module._trim_job_history(store, max_items=2)
+    assert removed == ["done_1"]
+    assert set(store) == {"running", "done_2"}
+
+
 def test_job_store_persists_and_loads(tmp_path, monkeypatch):
     """Job store should be saved to disk and restored correctly."""
     store_path = tmp_path / "persisted_jobs.json"
@@ -330,6 +451,124 @@ def test_job_store_persists_and_loads(tmp_path, monkeypatch):
     assert server_module.enrichment_jobs["enrich_1"]["status"] == "completed"
 
 
+def test_job_store_reencodes_only_the_upserted_job(tmp_path, monkeypatch):
+    """JSON job store should reuse serialized payloads of untouched jobs."""
+    store_path = tmp_path / "cached_jobs.json"
+    monkeypatch.setattr(server_module, "JOB_STORE_BACKEND", "json")
+    monkeypatch.setattr(server_module, "JOB_STORE_PATH", store_path)
+    server_module.ingestion_jobs.clear()
+    server_module.enrichment_jobs.clear()
+
+    server_module._upsert_job(server_module.ingestion_jobs, "a", {"job_id": "a", "status": "processing"})
+    server_module._upsert_job(server_module.enrichment_jobs, "b", {"job_id": "b", "status": "processing"})
+
+    encoded = []
+    original_dumps = server_module._dumps
+
+    def _counting_dumps(obj, indent=False):
+        if isinstance(obj, dict):
+            encoded.append(obj.get("job_id"))
+        return original_dumps(obj, indent=indent)
+
+    monkeypatch.setattr(server_module, "_dumps", _counting_dumps)
+    server_module._upsert_job(server_module.ingestion_jobs, "a", {"status": "completed"})
+
+    assert encoded == ["a"]
+    data = json.loads(store_path.read_text(encoding="utf-8"))
+    assert data["ingestion_jobs"]["a"]["status"] == "completed"
+    assert data["enrichment_jobs"]["b"]["status"] == "processing"
+    assert data["gardener_runs"] == {}
+
+
+def test_upsert_job_publishes_new_payload_for_lock_free_readers(tmp_path, monkeypatch):
+    """Status readers should keep a consistent payload while updates land."""
+    monkeypatch.setattr(server_module, "JOB_STORE_BACKEND", "json")
+    monkeypatch.setattr(server_module, "JOB_STORE_PATH", tmp_path / "cow_jobs.json")
+    server_module.ingestion_jobs.clear()
+
+    server_module._upsert_job(server_module.ingestion_jobs, "cow", {"job_id": "cow", "status": "processing"})
+    before = server_module.get_job_status("cow")
+    server_module._upsert_job(server_module.ingestion_jobs, "cow", {"status": "completed"})
+
+    assert before["status"] == "processing"
+    assert server_module.get_job_status("cow")["status"] == "completed"
+    assert server_module.get_job_status("cow") is not before
+
+
+def test_job_store_debounced_flush_batches_updates(tmp_path, monkeypatch):
+    """With JOB_STORE_FLUSH_INTERVAL_MS set, updates are written later in one batch."""
+    db_path = tmp_path / "debounced_jobs.db"
+    monkeypatch.setattr(server_module, "JOB_STORE_BACKEND", "sqlite")
+    monkeypatch.setattr(server_module, "JOB_STORE_SQLITE_PATH", db_path)
+    monkeypatch.setattr(server_module, "JOB_STORE_FLUSH_INTERVAL_MS", 200)
+    server_module.ingestion_jobs.clear()
+
+    for status in ("queued", "processing", "completed"):
+        server_module._upsert_job(server_module.ingestion_jobs, "debounced", {"job_id": "debounced", "status": status})
+    assert not db_path.exists()
+
+    deadline = time.monotonic() + 5
+    while not db_path.exists() and time.monotonic() < deadline:
+        time.sleep(0.05)
+    server_module._flush_pending_job_store()
+
+    with server_module._job_store_lock:
+        row = server_module._sqlite_connection_locked().execute(
+            "SELECT payload FROM job_store WHERE job_id = 'debounced'"
+        ).fetchone()
+        server_module._close_sqlite_connection_locked()
+    assert json.loads(row[0])["status"] == "completed"
+
+
+def test_job_store_failed_flush_keeps_changes_buffered(tmp_path, monkeypatch):
+    """A failed flush should leave its changes queued for the next attempt."""
+    db_path = tmp_path / "retry_jobs.db"
+    monkeypatch.setattr(server_module, "JOB_STORE_BACKEND", "sqlite")
+    monkeypatch.setattr(server_module, "JOB_STORE_SQLITE_PATH", db_path)
+    server_module.ingestion_jobs.clear()
+    server_module.ingestion_jobs["retry"] = {"job_id": "retry", "status": "completed"}
+    original_persist = server_module._persist_job_rows_sqlite_locked
+
+    def _locked_persist(changed):
+        raise sqlite3.OperationalError("database is locked")
+
+    with server_module._job_store_lock:
+        server_module._job_store_dirty.add(("ingestion", "retry"))
+    monkeypatch.setattr(server_module, "_persist_job_rows_sqlite_locked", _locked_persist)
+    with pytest.raises(sqlite3.OperationalError):
+        server_module._flush_pending_job_store()
+    assert ("ingestion", "retry") in server_module._job_store_dirty
+
+    monkeypatch.setattr(server_module, "_persist_job_rows_sqlite_locked", original_persist)
+    server_module._flush_pending_job_store()
+    assert not server_module._job_store_dirty
+    with server_module._job_store_lock:
+        row = server_module._sqlite_connection_locked().execute(
+            "SELECT payload FROM job_store WHERE job_id = 'retry'"
+        ).fetchone()
+        server_module._close_sqlite_connection_locked()
+    assert json.loads(row[0])["status"] == "completed"
+
+
+def test_job_store_json_skips_identical_rewrites(tmp_path, monkeypatch):
+    """JSON job store should not rewrite the file when content is unchanged."""
+    store_path = tmp_path / "unchanged_jobs.json"
+    monkeypatch.setattr(server_module, "JOB_STORE_BACKEND", "json")
+    monkeypatch.setattr(server_module, "JOB_STORE_PATH", store_path)
+    server_module.ingestion_jobs.clear()
+    server_module.enrichment_jobs.clear()
+
+    server_module._upsert_job(server_module.ingestion_jobs, "same", {"job_id": "same", "status": "processing"})
+    first_mtime = store_path.stat().st_mtime_ns
+    time.sleep(0.01)
+    server_module._upsert_job(server_module.ingestion_jobs, "same", {"status": "processing"})
+    assert store_path.stat().st_mtime_ns == first_mtime
+
+    server_module._upsert_job(server_module.ingestion_jobs, "same", {"status": "completed"})
+    assert json.loads(store_path.read_text(encoding="utf-8"))["ingestion_jobs"]["same"]["status"] == "completed"
+    assert not store_path.with_suffix(".json.tmp").exists()
+
+
 def test_job_store_sqlite_persists_and_loads(tmp_path, monkeypatch):
     """SQLite job store should save and restore ingestion/enrichment jobs."""
     db_path = tmp_path / "persisted_jobs.db"
@@ -359,6 +598,144 @@ def test_job_store_sqlite_persists_and_loads(tmp_path, monkeypatch):
     assert server_module.enrichment_jobs["enrich_sql_1"]["status"] == "completed"
 
 
+def test_job_store_sqlite_reuses_wal_connection(tmp_path, monkeypatch):
+    """SQLite job store should keep one WAL-mode connection across writes."""
+    monkeypatch.setattr(server_module, "JOB_STORE_BACKEND", "sqlite")
+    monkeypatch.setattr(server_module, "JOB_STORE_SQLITE_PATH", tmp_path / "wal_jobs.db")
+
+    server_module._upsert_job(server_module.ingestion_jobs, "wal_1", {"job_id": "wal_1"})
+    conn = server_module._sqlite_conn
+    server_module._upsert_job(server_module.ingestion_jobs, "wal_2", {"job_id": "wal_2"})
+
+    assert server_module._sqlite_conn is conn
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    with server_module._job_store_lock:
+        server_module._close_sqlite_connection_locked()
+    assert server_module._sqlite_conn is None
+
+
+def test_job_store_sqlite_upserts_rows_and_deletes_trimmed(tmp_path, monkeypatch):
+    """SQLite job store should update single rows and drop trimmed history."""
+    monkeypatch.setattr(server_module, "JOB_STORE_BACKEND", "sqlite")
+    monkeypatch.setattr(server_module, "JOB_STORE_SQLITE_PATH", tmp_path / "upsert_jobs.db")
+    monkeypatch.setattr(server_module, "MAX_JOB_HISTORY", 2)
+    server_module.ingestion_jobs.clear()
+
+    for idx in range(1, 4):
+        server_module._upsert_job(
+            server_module.ingestion_jobs,
+            f"job_{idx}",
+            {"job_id": f"job_{idx}", "started_at": f"2026-01-0{idx}T00:00:00"},
+        )
+    server_module._upsert_job(server_module.ingestion_jobs, "job_3", {"status": "completed"})
+
+    rows = server_module._sqlite_conn.execute(
+        "SELECT job_id, payload FROM job_store WHERE kind = 'ingestion' ORDER BY job_id"
+    ).fetchall()
+    assert [job_id for job_id, _ in rows] == ["job_2", "job_3"]
+    assert json.loads(rows[1][1])["status"] == "completed"
+    with server_module._job_store_lock:
+        server_module._close_sqlite_connection_locked()
+
+
+def test_job_store_sqlite_full_rewrite_covers_all_kinds(tmp_path, monkeypatch):
+    """A full SQLite save should write one row per job across every job kind."""
+    monkeypatch.setattr(server_module, "JOB_STORE_BACKEND", "sqlite")
+    monkeypatch.setattr(server_module, "JOB_STORE_SQLITE_PATH", tmp_path / "full_jobs.db")
+    server_module.ingestion_jobs.clear()
+    server_module.enrichment_jobs.clear()
+    server_module.gardener_runs.clear()
+    server_module.ingestion_jobs["i1"] = {"job_id": "i1"}
+    server_module.enrichment_jobs["e1"] = {"job_id": "e1"}
+    server_module.gardener_runs["g1"] = {"job_id": "g1", "started_at": "2026-01-01T00:00:00"}
+
+    server_module._save_job_store()
+
+    with server_module._job_store_lock:
+        rows = server_module._sqlite_connection_locked().execute(
+            "SELECT kind, job_id, started_at FROM job_store ORDER BY kind"
+        ).fetchall()
+        server_module._close_sqlite_connection_locked()
+    assert rows == [
+        ("enrichment", "e1", ""),
+        ("gardener", "g1", "2026-01-01T00:00:00"),
+        ("ingestion", "i1", ""),
+    ]
+    server_module.gardener_runs.clear()
+
+
+def test_list_brains_reuses_cached_info_until_brain_changes(tmp_path, monkeypatch):
+    """GET /brains should skip re-walking brains whose directories are unchanged."""
+    client = _make_test_client(tmp_path, monkeypatch)
+    brain = Brain("listed", base_path=str(tmp_path))
+    brain.initialize("Track the plot")
+
+    first = client.get("/brains").json()
+    assert first == [{"name": "listed", "objective": "Track the plot", "file_count": 5}]
+
+    walks = []
+    original_rglob = Path.rglob
+
+    def _counting_rglob(self, pattern):
+        walks.append(self)
+        return original_rglob(self, pattern)
+
+    monkeypatch.setattr(Path, "rglob", _counting_rglob)
+    assert client.get("/brains").json() == first
+    assert walks == []
+
+    time.sleep(0.01)
+    brain.write_file("characters/alice.md", "# Alice\n")
+    refreshed = client.get("/brains").json()
+    assert refreshed[0]["file_count"] == 6
+    assert len(walks) == 1
+
+
+def test_list_brains_sees_nested_files_and_prunes_deleted_brains(tmp_path, monkeypatch):
+    """Files written below category dirs refresh the count; removed brains leave the cache."""
+    client = _make_test_client(tmp_path, monkeypatch)
+    brain = Brain("nested", base_path=str(tmp_path))
+    brain.initialize("Track reports")
+    brain.write_file("meta/reports/gardener_1.md", "# Report\n")
+    assert client.get("/brains").json()[0]["file_count"] == 6
+
+    time.sleep(0.01)
+    brain.write_file("meta/reports/gardener_2.md", "# Report\n")
+    brain.write_file("meta/reports/gardener_2.json", "{}")
+    assert client.get("/brains").json()[0]["file_count"] == len(brain.list_files()) == 8
+
+    key = os.path.abspath(brain.path)
+    assert key in server_module._brain_info_cache
+    shutil.rmtree(brain.path)
+    assert client.get("/brains").json() == []
+    assert key not in server_module._brain_info_cache
+
+
+def test_brain_content_reads_titles_and_summaries(tmp_path, monkeypatch):
+    """Explorer content should parse titles past the head window and skip other dirs."""
+    client = _make_test_client(tmp_path, monkeypatch)
+    brain = Brain("explorer", base_path=str(tmp_path))
+    brain.initialize("Explore")
+    brain.write_file("characters/tommy_nolan.md", "# Tommy Nolan\n\nA hard-working father.\n")
+    padding = "---\n" * 1000
+    brain.write_file("themes/late_title.md", padding + "# Late Title\nBody line\n")
+    brain.write_file("notes/ignored.md", "# Ignored\n")
+    brain.write_file("facts/empty.md", "")
+
+    payload = client.get("/brains/explorer/content").json()
+
+    assert payload["characters"] == [{
+        "id": "characters/tommy_nolan.md",
+        "name": "Tommy Nolan",
+        "summary": "A hard-working father....",
+        "tags": ["Characters"],
+    }]
+    assert payload["themes"][0]["name"] == "Late Title"
+    assert payload["themes"][0]["summary"] == "Body line..."
+    assert payload["facts"] == []
+    assert payload["timeline"] == []
+
+
 def test_get_file_rejects_path_traversal(tmp_path, monkeypatch):
     """Path traversal attempts should be rejected with 400."""
     client = _make_test_client(tmp_path, monkeypatch)
@@ -410,6 +787,41 @@ def test_query_auto_enrich_schedules_background_job(tmp_path, monkeypatch):
     assert payload["status"] in ("processing", "completed")
 
 
+def test_query_sync_enrich_answers_with_enriched_files_without_reselecting(tmp_path, monkeypatch):
+    """Synchronous auto-enrichment should reuse the selection plus files enrichment wrote."""
+    client = _make_test_client(tmp_path, monkeypatch)
+    brain = Brain("sync-enrich-brain", base_path=tmp_path)
+    brain.initialize("test objective")
+
+    selections = []
+    answered = []
+
+    def _fake_select(question, brain, llm_client):
+        selections.append(question)
+        return FileSelection(files=["facts/old.md"], reasoning="test")
+
+    def _fake_answer(question, brain, selected_files, client):
+        answered.append(list(selected_files))
+        confidence = "high" if "facts/new.md" in selected_files else "low"
+        return QueryResult(answer="answer", sources=list(selected_files), confidence=confidence)
+
+    monkeypatch.setattr(server_module, "get_client", lambda provider, model: object())
+    monkeypatch.setattr(server_module, "select_relevant_files", _fake_select)
+    monkeypatch.setattr(server_module, "answer_from_brain", _fake_answer)
+    monkeypatch.setattr(enrichment_module.EnrichmentManager, "evaluate_gap", lambda self, q, p, m: (True, [1]))
+    monkeypatch.setattr(enrichment_module.EnrichmentManager, "enrich", lambda self, q, p, m: ["facts/new.md"])
+
+    response = client.post(
+        f"/brains/{brain.name}/query",
+        json={"question": "Where?", "auto_enrich": True, "async_enrich": False, "provider": "anthropic"},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["confidence"] == "high"
+    assert len(selections) == 1
+    assert answered == [["facts/old.md"], ["facts/old.md", "facts/new.md"]]
+
+
 def test_claim_endpoints_list_show_history(tmp_path, monkeypatch):
     """Claim endpoints should expose snapshots and lifecycle history when enabled."""
     client = _make_test_client(tmp_path, monkeypatch)
@@ -572,6 +984,7 @@ def test_ingest_rejects_oversized_upload(tmp_path, monkeypatch):
 
     assert response.status_code == 413
     assert "MAX_UPLOAD_MB=1" in response.json()["detail"]
+    assert list((tmp_path / "uploads").glob("*")) == []
 
 
 def test_ingest_uses_configured_subprocess_timeout(tmp_path, monkeypatch):
@@ -596,6 +1009,75 @@ def test_ingest_uses_configured_subprocess_timeout(tmp_path, monkeypatch):
     assert captured["timeout"] == 7
 
 
+def test_ingest_in_process_calls_pipeline_without_subprocess(tmp_path, monkeypatch):
+    """INGEST_IN_PROCESS should run the pipeline directly instead of spawning a CLI."""
+    import cognitive_book_os.ingest as ingest_module
+
+    client = _make_test_client(tmp_path, monkeypatch)
+    monkeypatch.setattr(server_module, "INGEST_IN_PROCESS", True)
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    for env_name in ("MINIMAX_API_KEY", "OPENROUTER_API_KEY", "ANTHROPIC_API_KEY"):
+        monkeypatch.delenv(env_name, raising=False)
+
+    def _unexpected_run(*args, **kwargs):
+        raise AssertionError("subprocess.run should not be called")
+
+    captured = {}
+
+    def _fake_process_document(**kwargs):
+        captured.update(kwargs)
+
+    monkeypatch.setattr(subprocess, "run", _unexpected_run)
+    monkeypatch.setattr(ingest_module, "process_document", _fake_process_document)
+
+    response = client.post(
+        "/ingest",
+        files={"file": ("book.pdf", b"%PDF-1.7\nx", "application/pdf")},
+        data={"brain_name": "inproc", "strategy": "standard"},
+    )
+    assert response.status_code == 200
+    assert captured["brain_name"] == "inproc"
+    assert captured["provider"] == "openai"
+    assert captured["brains_dir"] == str(tmp_path)
+    job = server_module.ingestion_jobs[response.json()["job_id"]]
+    assert job["status"] == "completed"
+
+
+def test_ingest_in_process_timeout_keeps_pdf_and_records_late_result(tmp_path, monkeypatch):
+    """A timed-out in-process job is reported as still running and finishes its own record."""
+    import threading
+    import cognitive_book_os.ingest as ingest_module
+
+    client = _make_test_client(tmp_path, monkeypatch)
+    monkeypatch.setattr(server_module, "INGEST_IN_PROCESS", True)
+    monkeypatch.setattr(server_module, "INGEST_TIMEOUT_SEC", 0)
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    release = threading.Event()
+    monkeypatch.setattr(ingest_module, "process_document", lambda **kwargs: release.wait(5))
+
+    response = client.post(
+        "/ingest",
+        files={"file": ("book.pdf", b"%PDF-1.7\nx", "application/pdf")},
+        data={"brain_name": "slow", "strategy": "standard"},
+    )
+    assert response.status_code == 200
+    job_id = response.json()["job_id"]
+    job = server_module.ingestion_jobs[job_id]
+    pdf_path = tmp_path / "uploads" / job["stored_filename"]
+    assert job["status"] == "timed_out"
+    assert pdf_path.exists()
+
+    release.set()
+    deadline = time.monotonic() + 5
+    while server_module.ingestion_jobs[job_id]["status"] == "timed_out" and time.monotonic() < deadline:
+        time.sleep(0.01)
+    job = server_module.ingestion_jobs[job_id]
+    assert job["status"] == "completed"
+    assert job["error"] is None
+    assert job["source_pdf_path"] == str(pdf_path)
+    assert pdf_path.exists()
+
+
 def test_ingest_keeps_uploaded_pdf_for_future_enrichment(tmp_path, monkeypatch):
     """Successful ingestion should preserve uploaded PDF for later enrichment runs."""
     client = _make_test_client(tmp_path, monkeypatch)